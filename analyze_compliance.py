@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path
 from io import BytesIO
@@ -14,6 +15,9 @@ from src.style.report_generator import HarvardComplianceReportGenerator
 from src.style.models import ReferenceMetadata, Violation
 from src.formatting import CitationFormatter
 
+# Severities counted in the top-violations tally
+TALLY_SEVERITIES = frozenset({'error', 'warning'})
+
 def analyze_compliance():
     importer = DocxImporter()
     checker = HarvardStyleChecker()
@@ -24,8 +28,11 @@ def analyze_compliance():
     references_meta = []
     all_violations = []
     
-    for pub in pubs:
-        ref_id = str(uuid.uuid4())
+    # Same random v4 UUIDs as uuid.uuid4(), drawn from one urandom call
+    raw = os.urandom(16 * len(pubs))
+    ref_ids = [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, len(raw), 16)]
+    
+    for pub, ref_id in zip(pubs, ref_ids):
         formatted = CitationFormatter.reference_entry(pub, "harvard")
         meta = ReferenceMetadata(id=ref_id, display_title=pub.title, formatted_ref=formatted)
         references_meta.append(meta)
@@ -46,7 +53,7 @@ def analyze_compliance():
                  print(f"  - {v.severity.upper()}: {v.message}")
 
     print("\n--- TOP VIOLATIONS ---")
-    tally = Counter(v.rule_id for v in all_violations if v.severity in ['error', 'warning'])
+    tally = Counter(v.rule_id for v in all_violations if v.severity in TALLY_SEVERITIES)
     for rule, count in tally.most_common(5):
         print(f"{rule}: {count}")
 
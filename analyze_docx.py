@@ -1,31 +1,77 @@
-import docx
 import json
+import re
+
+from src.importers.docx_fast import iter_paragraphs
+
+SECTION_KEYWORDS = (
+    "How to include authors", "Online module materials", "Forum messages",
+    "Books", "Chapter in edited book", "Journal articles", "Newspaper articles",
+    "Web pages", "Online images"
+)
+# Earlier keywords win when a heading mentions more than one.
+_KEYWORD_RANK = {kw.lower(): i for i, kw in enumerate(SECTION_KEYWORDS)}
+
+try:
+    # Hyperscan compiles all keywords into one DFA; worthwhile when scanning
+    # thousands of documents.
+    import hyperscan
+
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[re.escape(kw).encode("utf-8") for kw in SECTION_KEYWORDS],
+        ids=list(range(len(SECTION_KEYWORDS))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(SECTION_KEYWORDS),
+    )
+
+    def _on_match(rank, start, end, flags, hits):
+        hits.append(rank)
+
+    def _keyword_ranks(low):
+        hits = []
+        _HS_DB.scan(low.encode("utf-8"), match_event_handler=_on_match, context=hits)
+        return hits
+except ImportError:
+    try:
+        import ahocorasick
+
+        _AUTOMATON = ahocorasick.Automaton()
+        for _kw in SECTION_KEYWORDS:
+            _AUTOMATON.add_word(_kw.lower(), _KEYWORD_RANK[_kw.lower()])
+        _AUTOMATON.make_automaton()
+
+        def _keyword_ranks(low):
+            return [rank for _, rank in _AUTOMATON.iter(low)]
+    except ImportError:
+        # Overlapping lookahead so every keyword occurrence is reported, not just
+        # the leftmost one.
+        _KEYWORD_RE = re.compile(
+            "(?=(" + "|".join(re.escape(kw.lower()) for kw in SECTION_KEYWORDS) + "))"
+        )
+
+        def _keyword_ranks(low):
+            return [_KEYWORD_RANK[m.group(1)] for m in _KEYWORD_RE.finditer(low)]
+
+def match_section(text):
+    """Return the section keyword that ``text`` is a heading for, if any."""
+    if len(text) >= 50:
+        return None
+    ranks = _keyword_ranks(text.lower())
+    return SECTION_KEYWORDS[min(ranks)] if ranks else None
 
 def analyze_docx(filename):
-    doc = docx.Document(filename)
     results = []
     current_section = "General"
     
-    for para in doc.paragraphs:
-        text = para.text.strip()
+    for text in iter_paragraphs(filename):
+        text = text.strip()
         if not text:
             continue
             
         # Try to identify sections based on keywords
-        keywords = [
-            "How to include authors", "Online module materials", "Forum messages",
-            "Books", "Chapter in edited book", "Journal articles", "Newspaper articles",
-            "Web pages", "Online images"
-        ]
-        
-        found_section = False
-        for kw in keywords:
-            if kw.lower() in text.lower() and len(text) < 50:
-                current_section = kw
-                found_section = True
-                break
-        
-        if not found_section:
+        section = match_section(text)
+        if section:
+            current_section = section
+        else:
             results.append({
                 "section": current_section,
                 "text": text
@@ -1,9 +1,54 @@
 """API utilities and error handling for reference management."""
 import requests
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Type
 from functools import wraps
 import logging
 
+from config import HTTP_CACHE_FILE, HTTP_CACHE_EXPIRE_AFTER
+
+# Identical CrossRef/Google Books queries return identical JSON, so keep
+# successful responses on disk and serve repeats without touching the network.
+try:
+    import requests_cache
+    SESSION = requests_cache.CachedSession(
+        HTTP_CACHE_FILE,
+        expire_after=HTTP_CACHE_EXPIRE_AFTER,
+        allowable_codes=(200,),
+        cache_control=True,
+        stale_if_error=True,
+    )
+except ImportError:
+    SESSION = requests.Session()
+
+# Looked up along the exception's MRO, so subclasses (e.g. ConnectTimeout)
+# resolve to their most specific entry. Anything not listed is a bug and
+# propagates instead of being logged and swallowed.
+_ERR_MSGS: Dict[Type[BaseException], str] = {
+    requests.ConnectionError: "Could not connect to API",
+    requests.Timeout: "Request to API timed out",
+    requests.RequestException: "API request failed",
+    ValueError: "Error processing API response",
+}
+
+def _log_api_error(e: BaseException, url: Optional[str] = None) -> bool:
+    """
+    Log a known API error.
+    
+    Args:
+        e: The exception raised by the request
+        url: The requested URL, included in the log line when known
+        
+    Returns:
+        bool: True if the error was recognised and logged, False otherwise
+    """
+    for cls in type(e).__mro__:
+        msg = _ERR_MSGS.get(cls)
+        if msg is not None:
+            where = f" while accessing {url}" if url else ""
+            logging.error(f"{msg}{where}: {str(e)}")
+            return True
+    return False
+
 def api_error_handler(func):
     """
     Decorator for handling API request errors.
@@ -18,16 +63,9 @@ def api_error_handler(func):
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except requests.ConnectionError:
-            logging.error("Could not connect to API. Please check your internet connection.")
-        except requests.Timeout:
-            logging.error("Request to API timed out. Please try again.")
-        except requests.RequestException as e:
-            logging.error(f"API request failed: {str(e)}")
-        except ValueError as e:
-            logging.error(f"Error processing API response: {str(e)}")
         except Exception as e:
-            logging.error(f"Unexpected error: {str(e)}")
+            if not _log_api_error(e):
+                raise
         return None
     return wrapper
 
@@ -44,15 +82,10 @@ def safe_request(url: str, params: Dict[str, Any], timeout: int = 10) -> Optiona
         Optional[Dict]: JSON response if successful, None otherwise
     """
     try:
-        response = requests.get(url, params=params, timeout=timeout)
+        response = SESSION.get(url, params=params, timeout=timeout)
         response.raise_for_status()
         return response.json()
-    except requests.ConnectionError:
-        logging.error(f"Connection error while accessing {url}")
-    except requests.Timeout:
-        logging.error(f"Request timeout while accessing {url}")
-    except requests.RequestException as e:
-        logging.error(f"Request failed for {url}: {str(e)}")
-    except ValueError as e:
-        logging.error(f"Invalid JSON response from {url}: {str(e)}")
-    return None
\ No newline at end of file
+    except Exception as e:
+        if not _log_api_error(e, url):
+            raise
+    return None
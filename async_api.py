@@ -1,15 +1,141 @@
-from typing import List, Optional, Dict
+from typing import Any, Awaitable, Callable, Optional, Dict, Tuple
+from collections import OrderedDict
+import copy
+from functools import wraps
 import aiohttp
 import asyncio
 from .types import Publication
-from .config import CROSSREF_API_URL, GOOGLE_BOOKS_API_URL, CROSSREF_MAILTO, GOOGLE_BOOKS_API_KEY
+from .config import (
+    CROSSREF_API_URL, GOOGLE_BOOKS_API_URL, CROSSREF_MAILTO, GOOGLE_BOOKS_API_KEY,
+    ASYNC_HTTP_CACHE_FILE, HTTP_CACHE_EXPIRE_AFTER
+)
+
+try:
+    from aiohttp_client_cache import CachedSession, SQLiteBackend
+    HAS_HTTP_CACHE = True
+except ImportError:
+    HAS_HTTP_CACHE = False
+
+# Optional speedups (pip install reference_manager[speedups]): aiodns keeps
+# DNS resolution off the event loop and Brotli lets the APIs compress with br.
+try:
+    import aiodns  # noqa: F401
+    HAS_AIODNS = True
+except ImportError:
+    HAS_AIODNS = False
+
+try:
+    import brotli  # noqa: F401
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+DEFAULT_HEADERS: Dict[str, str] = {
+    "Accept-Encoding": "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+}
+
+_SESSION: Optional[aiohttp.ClientSession] = None
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+async def _get_session() -> aiohttp.ClientSession:
+    """
+    Return the shared client session, creating it on first use.
+
+    CrossRef and Google Books lookups share one connection pool so repeated
+    queries reuse open TCP/TLS connections instead of handshaking each time.
+    A session is bound to the event loop that created it, so a new one is
+    made whenever the running loop changes (e.g. a second asyncio.run()),
+    after closing the old one.
+    """
+    global _SESSION, _SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _SESSION is None or _SESSION.closed or _SESSION_LOOP is not loop:
+        if _SESSION is not None and not _SESSION.closed:
+            await _close_on_owner(_SESSION, _SESSION_LOOP)
+        _SESSION_LOOP = loop
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            resolver=aiohttp.AsyncResolver() if HAS_AIODNS else None,
+            use_dns_cache=True,
+            ttl_dns_cache=300
+        )
+        session_kwargs = dict(
+            connector=connector,
+            headers=DEFAULT_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+        if HAS_HTTP_CACHE:
+            # Same cache policy as api_utils.safe_request, but a separate
+            # file: requests-cache cannot read aiohttp-client-cache entries
+            _SESSION = CachedSession(
+                cache=SQLiteBackend(
+                    ASYNC_HTTP_CACHE_FILE,
+                    expire_after=HTTP_CACHE_EXPIRE_AFTER,
+                    allowed_codes=(200,),
+                    cache_control=True
+                ),
+                **session_kwargs
+            )
+        else:
+            _SESSION = aiohttp.ClientSession(**session_kwargs)
+    return _SESSION
+
+async def _close_on_owner(session: aiohttp.ClientSession,
+                          owner: asyncio.AbstractEventLoop) -> None:
+    """Close ``session``, which was created on the event loop ``owner``."""
+    if owner is asyncio.get_running_loop() or owner.is_closed():
+        # On a closed loop aiohttp only marks the session and connector
+        # closed; the idle sockets are released when garbage collected
+        await session.close()
+    else:
+        # Its transports belong to a loop that is still alive; close there
+        asyncio.run_coroutine_threadsafe(session.close(), owner)
+
+async def close_session() -> None:
+    """Close the shared client session; call once at shutdown."""
+    global _SESSION, _SESSION_LOOP
+    if _SESSION is not None and not _SESSION.closed:
+        await _close_on_owner(_SESSION, _SESSION_LOOP)
+    _SESSION = None
+    _SESSION_LOOP = None
 
 async def async_get_json(url: str, params: Dict[str, str]) -> Dict:
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, params=params) as response:
-            response.raise_for_status()
-            return await response.json()
+    session = await _get_session()
+    async with session.get(url, params=params) as response:
+        response.raise_for_status()
+        return await response.json()
+
+def alru_cache(maxsize: int = 1024):
+    """
+    Bounded LRU memoization for coroutine functions.
+
+    Only truthy results are stored so transient API failures are retried on
+    the next call. Each caller gets its own deep copy of the result, so
+    mutating it cannot corrupt the cached value. The wrapped coroutine
+    exposes ``cache_clear()``.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        cache: "OrderedDict[Tuple, Any]" = OrderedDict()
 
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            if key in cache:
+                cache.move_to_end(key)
+                return copy.deepcopy(cache[key])
+            result = await func(*args, **kwargs)
+            if result:
+                cache[key] = result
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+                return copy.deepcopy(result)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+@alru_cache(maxsize=1024)
 async def async_search_crossref(query_text: str, rows: int = 1) -> Optional[Publication]:
     params = {
         "query.bibliographic": query_text,
@@ -25,6 +151,7 @@ async def async_search_crossref(query_text: str, rows: int = 1) -> Optional[Publ
     except Exception:
         return None
 
+@alru_cache(maxsize=1024)
 async def async_search_google_books(query_text: str, max_results: int = 5) -> Optional[Publication]:
     params = {
         "q": query_text,
@@ -46,25 +173,19 @@ async def async_lookup_work(query_text: str) -> Optional[Publication]:
     """
     Asynchronously search both APIs in parallel and return the first valid result
     """
-    crossref_task = asyncio.create_task(async_search_crossref(query_text))
-    books_task = asyncio.create_task(async_search_google_books(query_text))
-    
-    done, _ = await asyncio.wait(
-        [crossref_task, books_task],
-        return_when=asyncio.FIRST_COMPLETED
-    )
-    
-    for task in done:
-        result = await task
-        if result:
-            return result
-            
-    # If first API failed, wait for the second
-    remaining = [t for t in [crossref_task, books_task] if not t.done()]
-    if remaining:
-        results = await asyncio.gather(*remaining, return_exceptions=True)
-        for result in results:
-            if isinstance(result, dict):
+    tasks = [
+        asyncio.create_task(async_search_crossref(query_text)),
+        asyncio.create_task(async_search_google_books(query_text))
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if result:
                 return result
+    finally:
+        # Don't leave the slower lookup running once we have an answer
+        for task in tasks:
+            if not task.done():
+                task.cancel()
                 
-    return None
\ No newline at end of file
+    return None
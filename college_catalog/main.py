@@ -3,12 +3,20 @@ Dummy College Catalog API
 
 A simple API that simulates a college library catalog for development and testing.
 """
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
+from collections import defaultdict
+from functools import lru_cache
 import random
 from datetime import datetime, timedelta
+from pathlib import Path
+import hashlib
+import inspect
+import json
+import pickle
 import uvicorn
 import os
 
@@ -28,64 +36,136 @@ app.add_middleware(
 )
 
 # Sample data for the catalog
-SAMPLE_BOOKS = [
-    {
-        "id": f"BOOK-{i:04d}",
-        "title": f"Sample Book {i} Title",
-        "authors": [f"Author {i} Lastname", f"Co-Author {i} Surname"],
-        "publication_year": 2020 + (i % 4),
-        "item_type": "Book",
-        "call_number": f"QA76.{7000 + i} .S65 {2020 + (i % 4)}",
-        "available_copies": random.randint(1, 5),
-        "total_copies": random.randint(2, 8),
-        "location": random.choice(["Main Library, Floor 2", "Science Library, Floor 1"]),
-        "description": f"This is a sample book description for testing purposes. Book {i} covers important topics in the field.",
-        "subjects": ["Computer Science", "Testing", f"Topic {i % 5}"],
-        "isbn": f"978-{random.randint(1000000000, 9999999999)}",
-        "publisher": "Sample University Press",
-        "edition": f"{i % 5 + 1}st Edition" if (i % 5 + 1) == 1 else f"{i % 5 + 1}th Edition",
-        "language": "English",
-        "pages": str(random.randint(100, 800)),
-        "added_date": (datetime.now() - timedelta(days=random.randint(1, 365))).isoformat()
-    }
-    for i in range(1, 101)  # Generate 100 sample books
-]
-
-# Add some variety to the items
-for i in range(20, 40):
-    SAMPLE_BOOKS[i]["item_type"] = "E-Book"
-    SAMPLE_BOOKS[i]["available_copies"] = 1  # Unlimited e-books
-    SAMPLE_BOOKS[i]["total_copies"] = 1
-    SAMPLE_BOOKS[i]["location"] = "Online Access"
-
-# Add some journals and articles
-SAMPLE_JOURNALS = [
-    {
-        "id": f"JOUR-{i:04d}",
-        "title": f"Journal of Sample Studies Vol. {i}, No. {j}",
-        "authors": [f"Researcher {i} Name", f"Co-Researcher {j} Surname"],
-        "publication_year": 2020 + (i % 4),
-        "item_type": "Journal",
-        "volume": i % 10 + 1,
-        "issue": j + 1,
-        "pages": f"{i*10+1}-{i*10+15}",
-        "issn": f"1234-{5678 + i:04d}",
-        "available_copies": 1,
-        "total_copies": 1,
-        "location": "Periodicals Section, Floor 3",
-        "description": f"Academic journal article on various topics in sample studies.",
-        "subjects": ["Research", "Academic", f"Field {(i % 5) + 1}"],
-        "publisher": "Academic Press",
-        "language": "English",
-        "added_date": (datetime.now() - timedelta(days=random.randint(1, 365))).isoformat()
-    }
-    for i in range(1, 21)
-    for j in range(1, 5)  # 4 issues per volume
-]
+def _generate_sample_data() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Build the randomised sample books and journals."""
+    books = [
+        {
+            "id": f"BOOK-{i:04d}",
+            "title": f"Sample Book {i} Title",
+            "authors": [f"Author {i} Lastname", f"Co-Author {i} Surname"],
+            "publication_year": 2020 + (i % 4),
+            "item_type": "Book",
+            "call_number": f"QA76.{7000 + i} .S65 {2020 + (i % 4)}",
+            "available_copies": random.randint(1, 5),
+            "total_copies": random.randint(2, 8),
+            "location": random.choice(["Main Library, Floor 2", "Science Library, Floor 1"]),
+            "description": f"This is a sample book description for testing purposes. Book {i} covers important topics in the field.",
+            "subjects": ["Computer Science", "Testing", f"Topic {i % 5}"],
+            "isbn": f"978-{random.randint(1000000000, 9999999999)}",
+            "publisher": "Sample University Press",
+            "edition": f"{i % 5 + 1}st Edition" if (i % 5 + 1) == 1 else f"{i % 5 + 1}th Edition",
+            "language": "English",
+            "pages": str(random.randint(100, 800)),
+            "added_date": (datetime.now() - timedelta(days=random.randint(1, 365))).isoformat()
+        }
+        for i in range(1, 101)  # Generate 100 sample books
+    ]
+
+    # Add some variety to the items
+    for i in range(20, 40):
+        books[i]["item_type"] = "E-Book"
+        books[i]["available_copies"] = 1  # Unlimited e-books
+        books[i]["total_copies"] = 1
+        books[i]["location"] = "Online Access"
+
+    # Add some journals and articles
+    journals = [
+        {
+            "id": f"JOUR-{i:04d}",
+            "title": f"Journal of Sample Studies Vol. {i}, No. {j}",
+            "authors": [f"Researcher {i} Name", f"Co-Researcher {j} Surname"],
+            "publication_year": 2020 + (i % 4),
+            "item_type": "Journal",
+            "volume": i % 10 + 1,
+            "issue": j + 1,
+            "pages": f"{i*10+1}-{i*10+15}",
+            "issn": f"1234-{5678 + i:04d}",
+            "available_copies": 1,
+            "total_copies": 1,
+            "location": "Periodicals Section, Floor 3",
+            "description": f"Academic journal article on various topics in sample studies.",
+            "subjects": ["Research", "Academic", f"Field {(i % 5) + 1}"],
+            "publisher": "Academic Press",
+            "language": "English",
+            "added_date": (datetime.now() - timedelta(days=random.randint(1, 365))).isoformat()
+        }
+        for i in range(1, 21)
+        for j in range(1, 5)  # 4 issues per volume
+    ]
+    
+    return books, journals
+
+# Generating the sample data costs several hundred RNG and datetime calls, which
+# is paid on every start (and every `--reload`). Persist it next to this module
+# instead; the cache is keyed on the generator's source so edits invalidate it.
+_SAMPLE_CACHE_FILE = Path(__file__).with_name("_catalog_cache.pkl")
+
+def _load_sample_data() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Load the sample data from the on-disk cache, regenerating it if stale."""
+    try:
+        source_hash = hashlib.blake2b(
+            inspect.getsource(_generate_sample_data).encode("utf-8"), digest_size=16
+        ).hexdigest()
+    except (OSError, TypeError):
+        # No source to key the cache on (frozen build, .pyc-only install)
+        return _generate_sample_data()
+    try:
+        with open(_SAMPLE_CACHE_FILE, "rb") as f:
+            cached_hash, data = pickle.load(f)
+        if cached_hash == source_hash:
+            return data
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+    
+    data = _generate_sample_data()
+    tmp_path = _SAMPLE_CACHE_FILE.with_suffix(".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump((source_hash, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _SAMPLE_CACHE_FILE)
+    except OSError:
+        # Read-only deployments just regenerate on each start
+        pass
+    return data
+
+SAMPLE_BOOKS, SAMPLE_JOURNALS = _load_sample_data()
 
 # Combine all items
 CATALOG_ITEMS = SAMPLE_BOOKS + SAMPLE_JOURNALS
 
+# Search index, built once at import.
+# _SEARCH_FIELDS[i] holds the lowercased title, authors and subjects of
+# CATALOG_ITEMS[i]; _TRIGRAMS maps each character trigram of those fields to
+# the positions of the items containing it. Any item whose field contains the
+# query as a substring must contain every trigram of the query, so
+# intersecting posting lists gives a small candidate set to confirm against.
+_SEARCH_FIELDS: List[Tuple[str, ...]] = []
+_TRIGRAMS: Dict[str, Set[int]] = defaultdict(set)
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+for _pos, _item in enumerate(CATALOG_ITEMS):
+    _fields = tuple(
+        value.lower()
+        for value in [_item["title"], *_item["authors"], *_item["subjects"]]
+    )
+    _SEARCH_FIELDS.append(_fields)
+    for _field in _fields:
+        for _gram in _trigrams(_field):
+            _TRIGRAMS[_gram].add(_pos)
+
+def _candidate_positions(q_lower: str) -> List[int]:
+    """Positions of items that may match ``q_lower``, in catalog order."""
+    grams = _trigrams(q_lower)
+    if not grams:
+        # Queries shorter than three characters can't use the index
+        return list(range(len(CATALOG_ITEMS)))
+    postings = sorted((_TRIGRAMS.get(g, set()) for g in grams), key=len)
+    candidates = set.intersection(*postings)
+    return sorted(candidates)
+
+
 # Models
 class CatalogItem(BaseModel):
     id: str
@@ -116,6 +196,30 @@ class SearchResults(BaseModel):
     per_page: int
     items: List[CatalogItem]
 
+# The catalog is a fixed in-memory constant, so validate it into CatalogItem
+# models once here rather than on every request.
+for _item in CATALOG_ITEMS:
+    # Ensure pages is a string
+    if 'pages' in _item and _item['pages'] is not None:
+        _item['pages'] = str(_item['pages'])
+_CATALOG_MODELS: List[CatalogItem] = [CatalogItem(**item) for item in CATALOG_ITEMS]
+
+# Journal issues share a volume-level id; like the old linear scan, the first
+# item with a given id wins.
+_BY_ID: Dict[str, CatalogItem] = {}
+for _model in _CATALOG_MODELS:
+    _BY_ID.setdefault(_model.id, _model)
+
+# /items responses are fixed per item: serialize each once and derive a strong
+# ETag from the bytes so repeat clients can be answered with 304.
+_ITEM_PAYLOADS: Dict[str, Tuple[bytes, str]] = {}
+for _item_id, _model in _BY_ID.items():
+    _payload = json.dumps(
+        jsonable_encoder(_model), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    _etag = '"' + hashlib.blake2b(_payload, digest_size=16).hexdigest() + '"'
+    _ITEM_PAYLOADS[_item_id] = (_payload, _etag)
+
 # Routes
 @app.get("/")
 async def read_root():
@@ -134,12 +238,42 @@ async def search_items(
     """
     Search the catalog with various filters
     """
+    total, positions = _search_impl(
+        q, page, per_page, item_type, year_from, year_to, available_only
+    )
+    
+    return SearchResults(
+        total=total,
+        page=page,
+        per_page=per_page,
+        items=[_CATALOG_MODELS[pos] for pos in positions]
+    )
+
+@lru_cache(maxsize=512)
+def _search_impl(
+    q: str,
+    page: int,
+    per_page: int,
+    item_type: Optional[str],
+    year_from: Optional[int],
+    year_to: Optional[int],
+    available_only: bool
+) -> Tuple[int, Tuple[int, ...]]:
+    """
+    Filter and paginate the catalog.
+    
+    Returns (total matches, catalog positions of the requested page).
+    
+    The catalog is fixed for the life of the process, so identical requests
+    are served from the cache.
+    """
     # Simple search implementation (case-insensitive)
     q_lower = q.lower()
     
     # Filter items based on search query and filters
-    filtered_items = []
-    for item in CATALOG_ITEMS:
+    filtered_positions = []
+    for pos in _candidate_positions(q_lower):
+        item = CATALOG_ITEMS[pos]
         # Skip if doesn't match item type filter
         if item_type and item.get("item_type") != item_type:
             continue
@@ -155,48 +289,37 @@ async def search_items(
             continue
             
         # Check if query matches title, author, or subject
-        matches = (
-            q_lower in item["title"].lower() or
-            any(q_lower in author.lower() for author in item["authors"]) or
-            any(q_lower in subject.lower() for subject in item["subjects"])
-        )
-        
-        if matches:
-            filtered_items.append(item)
+        if any(q_lower in field for field in _SEARCH_FIELDS[pos]):
+            filtered_positions.append(pos)
     
     # Apply pagination
-    total = len(filtered_items)
     start = (page - 1) * per_page
     end = start + per_page
-    paginated_items = filtered_items[start:end]
-    
-    # Convert to CatalogItem to ensure proper serialization
-    catalog_items = []
-    for item in paginated_items:
-        # Ensure pages is a string
-        if 'pages' in item and item['pages'] is not None:
-            item['pages'] = str(item['pages'])
-        catalog_items.append(CatalogItem(**item))
-    
-    return SearchResults(
-        total=total,
-        page=page,
-        per_page=per_page,
-        items=catalog_items
-    )
+    return len(filtered_positions), tuple(filtered_positions[start:end])
 
 @app.get("/items/{item_id}", response_model=CatalogItem)
-async def get_item(item_id: str):
+async def get_item(item_id: str, request: Request):
     """
     Get details for a specific catalog item
+    
+    Supports conditional GET: a matching If-None-Match returns 304.
     """
-    for item in CATALOG_ITEMS:
-        if item["id"] == item_id:
-            # Ensure pages is a string
-            if 'pages' in item and item['pages'] is not None:
-                item['pages'] = str(item['pages'])
-            return CatalogItem(**item)
-    raise HTTPException(status_code=404, detail="Item not found")
+    cached = _ITEM_PAYLOADS.get(item_id)
+    if cached is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    payload, etag = cached
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = set()
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            # Weak comparison; str.removeprefix needs Python 3.9
+            candidates.add(tag[2:] if tag.startswith("W/") else tag)
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers={"ETag": etag})
+    
+    return Response(content=payload, media_type="application/json", headers={"ETag": etag})
 
 if __name__ == "__main__":
     # Create the directory if it doesn't exist
@@ -3,9 +3,41 @@ import json
 import difflib
 import sys
 import os
+from pathlib import Path
+from typing import Final, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# Fields compared per publication
+FIELDS: Final[Tuple[str, ...]] = (
+    "authors", "year", "pub_type", "title", "violations", "compliance_score"
+)
+
+# Deletion tables for normalization checks in categorize_discrepancy
+_TR_DOT: Final[dict] = str.maketrans('', '', '.')
+_TR_AB: Final[dict] = str.maketrans('', '', 'ab')
+
+# Below this many shared publications the plain loop is faster than building frames
+PANDAS_MIN_ROWS: Final[int] = 5000
 
 def load_json(path):
     try:
+        if orjson is not None:
+            # Parses straight from bytes; orjson.JSONDecodeError subclasses json's
+            data = Path(path).read_bytes()
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # orjson rejects NaN/Infinity, which json accepts
+                return json.loads(data.decode('utf-8'))
         with open(path, 'r', encoding='utf-8') as f:
             return json.load(f)
     except FileNotFoundError:
@@ -15,6 +47,12 @@ def load_json(path):
         print(f"Error decoding JSON {path}: {e}")
         return None
 
+def dump_json(data) -> bytes:
+    """Serialize ``data`` as indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
 def compare_lists(l1, l2):
     """Compare two lists of strings order-insensitively for basic equality, 
     or order-sensitively if needed. Authors are usually order-sensitive."""
@@ -35,7 +73,7 @@ def categorize_discrepancy(field, old_val, new_val):
         diffs = []
         for o, n in zip(old_val, new_val):
             if o != n:
-                if o.replace('.', '') == n.replace('.', ''):
+                if o.translate(_TR_DOT) == n.translate(_TR_DOT):
                     diffs.append("Punctuation change")
                     severity = "low"
                 elif "," in n and "," not in o:
@@ -53,7 +91,7 @@ def categorize_discrepancy(field, old_val, new_val):
         elif old_val and not new_val:
             severity = "high"
             note = "Year lost"
-        elif old_val.replace('a','').replace('b','') == new_val.replace('a','').replace('b',''):
+        elif str(old_val or '').translate(_TR_AB) == str(new_val or '').translate(_TR_AB):
              severity = "moderate"
              note = "Suffix handling changed"
         else:
@@ -99,8 +137,25 @@ def categorize_discrepancy(field, old_val, new_val):
 
     return severity, note
 
+def changed_field_mask(base_map, enh_map, keys) -> Optional["pd.DataFrame"]:
+    """Flag, per key and field, whether the two versions differ.
+
+    Returns a boolean frame (rows follow ``keys``, columns follow FIELDS), or
+    None when pandas is unavailable or the input is too small to benefit.
+    Cells missing on either side are always flagged: the frame cannot tell
+    None, NaN and an absent field apart, so the caller's own comparison
+    decides those.
+    """
+    if pd is None or len(keys) < PANDAS_MIN_ROWS:
+        return None
+    columns = list(FIELDS)
+    df_b = pd.DataFrame([base_map[k] for k in keys], columns=columns)
+    df_e = pd.DataFrame([enh_map[k] for k in keys], columns=columns)
+    return df_b.ne(df_e) | df_b.isna() | df_e.isna()
+
 def compare_publications(baseline, enhanced):
     report = []
+    append = report.append
     
     # Map by ID if possible, assuming list of dicts with 'id' or 'title'
     # Fallback to index matching if purely sequential
@@ -110,9 +165,15 @@ def compare_publications(baseline, enhanced):
     
     all_keys = set(base_map.keys()) | set(enh_map.keys())
     
+    # For large inputs, find the changed cells with one vectorized pass
+    common = [k for k in all_keys if k in base_map and k in enh_map]
+    mask = changed_field_mask(base_map, enh_map, common)
+    if mask is not None:
+        changed = dict(zip(common, mask.to_numpy()))
+    
     for key in all_keys:
         if key not in base_map:
-            report.append({
+            append({
                 "PublicationID": str(key),
                 "Field": "publication",
                 "Discrepancy": "New publication detected",
@@ -122,7 +183,7 @@ def compare_publications(baseline, enhanced):
             continue
             
         if key not in enh_map:
-            report.append({
+            append({
                 "PublicationID": str(key),
                 "Field": "publication",
                 "Discrepancy": "Publication lost",
@@ -131,28 +192,32 @@ def compare_publications(baseline, enhanced):
             })
             continue
             
-        b = base_map[key]
-        e = enh_map[key]
-        
-        # Fields to compare
-        fields = ["authors", "year", "pub_type", "title", "violations", "compliance_score"]
+        b_get = base_map[key].get
+        e_get = enh_map[key].get
+        pub_id = str(key)
+        fields = FIELDS
+        if mask is not None:
+            fields = [f for f, differs in zip(FIELDS, changed[key]) if differs]
         
         for f in fields:
-            val_b = b.get(f)
-            val_e = e.get(f)
+            val_b = b_get(f)
+            val_e = e_get(f)
+            
+            # Normalization might make fields distinct objects (lists), equality check handles it;
+            # the identity check skips it for shared objects and missing fields (None)
+            if val_b is val_e or val_b == val_e:
+                continue
             
-            # Normalization might make fields distinct objects (lists), equality check handles it
-            if val_b != val_e:
-                sev, note = categorize_discrepancy(f, val_b, val_e)
-                report.append({
-                    "PublicationID": str(key),
-                    "Field": f,
-                    "Discrepancy": f"{f} changed",
-                    "Severity": sev,
-                    "Notes": note,
-                    "OldValue": str(val_b)[:50],
-                    "NewValue": str(val_e)[:50]
-                })
+            sev, note = categorize_discrepancy(f, val_b, val_e)
+            append({
+                "PublicationID": pub_id,
+                "Field": f,
+                "Discrepancy": f"{f} changed",
+                "Severity": sev,
+                "Notes": note,
+                "OldValue": str(val_b)[:50],
+                "NewValue": str(val_e)[:50]
+            })
                 
     return report
 
@@ -188,7 +253,8 @@ def main():
 
     report = compare_publications(base, enh)
     
-    print(json.dumps(report, indent=2))
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dump_json(report) + b"\n")
 
 if __name__ == "__main__":
     main()
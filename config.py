@@ -9,6 +9,13 @@ DOWNLOAD_FOLDER: Final[str] = os.getcwd()
 CACHE_FILE: Final[str] = "cache.json"
 WORD_FILENAME: Final[str] = "references.docx"
 
+# HTTP response caches (used when requests-cache / aiohttp-client-cache are
+# installed). The two libraries use incompatible SQLite schemas, so each
+# gets its own file.
+HTTP_CACHE_FILE: Final[str] = "http_cache.sqlite"
+ASYNC_HTTP_CACHE_FILE: Final[str] = "http_cache_async.sqlite"
+HTTP_CACHE_EXPIRE_AFTER: Final[int] = 7 * 24 * 3600  # seconds
+
 # API Configuration
 CROSSREF_MAILTO: Final[str] = "stenford41@hotmail.com"  # Your email
 GOOGLE_BOOKS_API_KEY: Final[str] = os.getenv("GOOGLE_BOOKS_API_KEY", "")  # Set this in environment variable
@@ -1,13 +1,40 @@
-from typing import TypedDict, List, Optional
+from dataclasses import dataclass
+from typing import TypedDict, List, Tuple
 
 class Author(TypedDict):
     given: str
     family: str
 
-class Publication(TypedDict):
+# Publication is a frozen, slotted dataclass rather than a TypedDict:
+# slots keep per-instance memory down and instances are hashable, so they can
+# be used as dict keys and lru_cache arguments. __slots__ is spelled out
+# because dataclass(slots=True) needs Python 3.10.
+
+class _FrozenSlots:
+    """Copy/pickle support for frozen slotted dataclasses.
+
+    The default slot-state restore assigns through the frozen __setattr__
+    and raises FrozenInstanceError, so state is restored with
+    object.__setattr__ instead.
+    """
+    __slots__ = ()
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+@dataclass(frozen=True)
+class Publication(_FrozenSlots):
+    __slots__ = (
+        "source", "pub_type", "authors", "year", "title", "journal",
+        "publisher", "location", "volume", "issue", "pages", "doi"
+    )
     source: str
     pub_type: str
-    authors: List[str]
+    authors: Tuple[str, ...]
     year: str
     title: str
     journal: str
@@ -23,4 +50,4 @@ class CrossRefResponse(TypedDict):
     items: List[dict]
 
 class CacheDict(TypedDict):
-    pass  # This will store both query and author cache entries
\ No newline at end of file
+    pass  # This will store both query and author cache entries
@@ -1,10 +1,19 @@
 import re
 
+# Edition patterns, compiled once at import
+EDITION_RE = re.compile(r'(\d+(?:st|nd|rd|th)\s+edn?\.?)', re.IGNORECASE)
+
+# Alternative patterns under comparison
+ALTERNATIVE_PATTERNS = [
+    re.compile(r'(\d+(?:st|nd|rd|th)\s+edn?\.?)', re.IGNORECASE),
+    re.compile(r'(\d+(?:st|nd|rd|th)\s+ed(?:n|ition)?\.?)', re.IGNORECASE),
+    re.compile(r'\.?\s*(\d+(?:st|nd|rd|th)\s+edn?\.?)\s', re.IGNORECASE),
+]
+
 # Test edition pattern
 text = "Pfleeger, C. P. and Pfleeger, S. L.(2006) Security in computing. 4th edn. Upper Saddle River,NJ: Prentice Hall."
 
-edition_pattern = re.compile(r'(\d+(?:st|nd|rd|th)\s+edn?\.?)', re.IGNORECASE)
-edition_match = edition_pattern.search(text)
+edition_match = EDITION_RE.search(text)
 
 if edition_match:
     print(f"Found: '{edition_match.group(1)}'")
@@ -12,12 +21,6 @@ else:
     print("NOT FOUND")
     
 # Try alternative patterns
-patterns = [
-    r'(\d+(?:st|nd|rd|th)\s+edn?\.?)',
-    r'(\d+(?:st|nd|rd|th)\s+ed(?:n|ition)?\.?)',
-    r'\.?\s*(\d+(?:st|nd|rd|th)\s+edn?\.?)\s',
-]
-
-for i, pat in enumerate(patterns, 1):
-    match = re.search(pat, text, re.IGNORECASE)
+for i, pat in enumerate(ALTERNATIVE_PATTERNS, 1):
+    match = pat.search(text)
     print(f"Pattern {i}: {match.group(1) if match else 'NO MATCH'}")
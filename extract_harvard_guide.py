@@ -1,8 +1,13 @@
 import sys
 from pathlib import Path
-from docx import Document
+from src.importers.docx_fast import iter_paragraphs
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def extract_guide_content():
     """Extract structured content from Harvard referencing guide."""
     doc_path = "Harvard referencing guide.doc"
@@ -11,12 +16,10 @@ def extract_guide_content():
         print(f"Error: {doc_path} not found")
         return
     
-    doc = Document(doc_path)
-    
     # Extract all text
     all_text = []
-    for para in doc.paragraphs:
-        text = para.text.strip()
+    for text in iter_paragraphs(doc_path):
+        text = text.strip()
         if text:
             all_text.append(text)
     
@@ -26,8 +29,13 @@ def extract_guide_content():
         "content": all_text[:200]  # First 200 paragraphs
     }
     
-    with open("harvard_guide_extract.json", "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # orjson writes UTF-8 directly, matching ensure_ascii=False below
+        with open("harvard_guide_extract.json", "wb") as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        with open("harvard_guide_extract.json", "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
     
     print(f"Extracted {len(all_text)} paragraphs")
     print("\n=== FIRST 50 PARAGRAPHS ===\n")
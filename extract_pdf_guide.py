@@ -1,38 +1,91 @@
-import sys
+import hashlib
 from pathlib import Path
+
 try:
-    from PyPDF2 import PdfReader
+    import pypdfium2 as pdfium
 except ImportError:
-    print("PyPDF2 not installed. Installing...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "pypdf2"])
+    pdfium = None
+
+try:
     from PyPDF2 import PdfReader
+except ImportError:
+    PdfReader = None
 
 import json
 
+# Extracted text keyed by PDF content hash, so reruns skip extraction
+CACHE_DIR = Path(".cache")
+
+def iter_page_texts(pdf_path):
+    """Yield the extracted text of each page, using PDFium when available."""
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                try:
+                    # PDFium ends lines with CRLF; match PyPDF2's output
+                    yield textpage.get_text_range().replace("\r\n", "\n")
+                finally:
+                    textpage.close()
+                    page.close()
+        finally:
+            pdf.close()
+    else:
+        for page in PdfReader(pdf_path).pages:
+            yield page.extract_text()
+
+def _sha256_file(path):
+    """Hex SHA-256 of a file, read in chunks."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
+def load_page_texts(pdf_path):
+    """Return the page count and labelled page texts, cached on disk."""
+    digest = _sha256_file(pdf_path)
+    # Backends extract slightly different text, so each gets its own entry
+    backend = "pdfium" if pdfium is not None else "pypdf2"
+    cache_file = CACHE_DIR / f"{digest}-{backend}.json"
+    if cache_file.exists():
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        return cached["pages"], cached["text"]
+
+    all_text = []
+    page_count = 0
+    for page_num, text in enumerate(iter_page_texts(pdf_path), 1):
+        page_count = page_num
+        if text:
+            all_text.append(f"=== PAGE {page_num} ===\n{text}")
+
+    CACHE_DIR.mkdir(exist_ok=True)
+    cache_file.write_text(json.dumps({"pages": page_count, "text": all_text}), encoding="utf-8")
+    return page_count, all_text
+
 def extract_pdf_content():
     """Extract text from Harvard referencing guide PDF."""
     pdf_path = "Harvard referencing guide.pdf"
-    
+
     if not Path(pdf_path).exists():
         print(f"Error: {pdf_path} not found")
         return
-    
-    reader = PdfReader(pdf_path)
-    
-    all_text = []
-    for page_num, page in enumerate(reader.pages, 1):
-        text = page.extract_text()
-        if text:
-            all_text.append(f"=== PAGE {page_num} ===\n{text}")
-    
+
+    if pdfium is None and PdfReader is None:
+        print("Error: install pypdfium2 (or PyPDF2) to extract PDF text")
+        return
+
+    page_count, all_text = load_page_texts(pdf_path)
+
     # Save full content
-    with open("harvard_guide_full.txt", "w", encoding="utf-8") as f:
-        f.write("\n\n".join(all_text))
-    
-    print(f"Extracted {len(reader.pages)} pages")
+    Path("harvard_guide_full.txt").write_text("\n\n".join(all_text), encoding="utf-8")
+
+    print(f"Extracted {page_count} pages")
     print(f"Saved to harvard_guide_full.txt")
-    
+
     # Print first 2 pages for preview
     print("\n=== PREVIEW (First 2 Pages) ===\n")
     for text in all_text[:2]:
@@ -3,6 +3,7 @@ Initialize AI remediation tables in the production database.
 """
 import os
 import sys
+from datetime import datetime
 
 # Ensure project root is in sys.path
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__)))
@@ -13,6 +14,66 @@ from ui.app import app, db
 # Import AI models to register them with SQLAlchemy
 from src.ai_remediation.models import AISuggestion, AppliedSuggestion, FieldProvenance, AuditLog, FeatureFlag, UserFeatureFlag, RolloutCohort, RolloutHistory, MetricsEvent
 
+# Flags seeded (or re-enabled) on every run. Columns in _FLAG_UPDATE_COLUMNS
+# are overwritten when the flag already exists.
+DEFAULT_FLAGS = [
+    {
+        'flag_name': 'ai_suggestions',
+        'enabled': True,
+        'rollout_percentage': 100.0,
+        'rollout_strategy': 'percentage',
+        'description': 'AI-powered remediation suggestions for Week 5 testing',
+    },
+]
+_FLAG_UPDATE_COLUMNS = ('enabled', 'rollout_percentage')
+
+
+def _upsert_insert():
+    """Return the dialect's INSERT construct if it supports ON CONFLICT."""
+    dialect = db.engine.dialect.name
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        return None
+    return insert
+
+
+def seed_feature_flags(rows):
+    """Insert or update ``rows`` in feature_flags with one statement."""
+    names = [row['flag_name'] for row in rows]
+    existing = {
+        name for (name,) in
+        db.session.query(FeatureFlag.flag_name).filter(FeatureFlag.flag_name.in_(names))
+    }
+    for name in names:
+        print(f"{'Updating' if name in existing else 'Initializing'} feature flag: {name}")
+    
+    insert = _upsert_insert()
+    if insert is None:
+        # No ON CONFLICT support; fall back to the ORM
+        for row in rows:
+            flag = db.session.get(FeatureFlag, row['flag_name'])
+            if flag is None:
+                db.session.add(FeatureFlag(**row))
+            else:
+                for column in _FLAG_UPDATE_COLUMNS:
+                    setattr(flag, column, row[column])
+        return
+    
+    now = datetime.utcnow()
+    stmt = insert(FeatureFlag.__table__).values(
+        [dict(row, created_at=now, updated_at=now) for row in rows]
+    )
+    # Column onupdate hooks don't fire for ON CONFLICT, so set updated_at here
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['flag_name'],
+        set_={**{c: stmt.excluded[c] for c in _FLAG_UPDATE_COLUMNS}, 'updated_at': now}
+    )
+    db.session.execute(stmt)
+
+
 def init_tables():
     with app.app_context():
         print("Creating AI remediation tables...")
@@ -20,25 +81,10 @@ def init_tables():
         print("✓ Tables created.")
         
         # Enable ai_suggestions feature flag for testing
-        flag_name = 'ai_suggestions'
-        flag = FeatureFlag.query.get(flag_name)
-        if not flag:
-            print(f"Initializing feature flag: {flag_name}")
-            flag = FeatureFlag(
-                flag_name=flag_name,
-                enabled=True,
-                rollout_percentage=100.0,
-                rollout_strategy='percentage',
-                description='AI-powered remediation suggestions for Week 5 testing'
-            )
-            db.session.add(flag)
-        else:
-            print(f"Updating feature flag: {flag_name}")
-            flag.enabled = True
-            flag.rollout_percentage = 100.0
-        
+        seed_feature_flags(DEFAULT_FLAGS)
         db.session.commit()
-        print(f"✓ Feature flag '{flag_name}' is now ENABLED (100% rollout).")
+        for row in DEFAULT_FLAGS:
+            print(f"✓ Feature flag '{row['flag_name']}' is now ENABLED ({row['rollout_percentage']:.0f}% rollout).")
 
 if __name__ == "__main__":
     init_tables()
@@ -24,8 +24,8 @@ def setup_logging(log_dir: str = "logs", level: int = logging.INFO) -> None:
     log_format = '%(asctime)s - %(levelname)s - %(message)s'
     date_format = '%Y-%m-%d %H:%M:%S'
     
-    # Set up handlers
-    file_handler = logging.FileHandler(log_file)
+    # Set up handlers; the log file is only opened once something is logged
+    file_handler = logging.FileHandler(log_file, delay=True)
     console_handler = logging.StreamHandler()
     
     # Configure formatters
@@ -1,8 +1,11 @@
 from src.referencing import referencing
 import logging
+import re
 
 logging.basicConfig(level=logging.INFO)
 
+_YEAR_RE = re.compile(r'\d{4}')
+
 def test_author_filter():
     query = "Smith"
     year_from = 2023
@@ -29,8 +32,7 @@ def test_author_filter():
             
             # Check validity
             try:
-                import re
-                match = re.search(r'\d{4}', str(year))
+                match = _YEAR_RE.search(str(year))
                 if match:
                     y = int(match.group(0))
                     if y < year_from or y > year_to:
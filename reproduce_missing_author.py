@@ -1,8 +1,20 @@
-from src.reference_manager import ReferenceManager
-from src.name_utils import guess_first_last_from_author_query, names_match
+from src.reference_manager import get_manager
+from src.name_utils import guess_first_last_from_author_query, names_match, names_match_batch
 import logging
+import os
 
-logging.basicConfig(level=logging.DEBUG)
+def split_author(auth_str):
+    """Split a "Surname, Given" or "Given Surname" string into (given, family)."""
+    if "," in auth_str:
+        family, given = auth_str.split(",", 1)
+        return given.strip(), family.strip()
+    parts = auth_str.split()
+    if len(parts) >= 2:
+        return " ".join(parts[:-1]), parts[-1]
+    return "", auth_str
+
+# Debug output from the manager is opt-in: DEBUG_LOG=1 python reproduce_missing_author.py
+logging.basicConfig(level=logging.DEBUG if os.environ.get("DEBUG_LOG") else logging.WARNING)
 
 def debug_missing_author():
     query = "ruvinga stenford"
@@ -27,18 +39,22 @@ def debug_missing_author():
 
     # 3. Run Actual Search (to see API results and filtering in action)
     print("\n--- Running Manager Search ---")
-    mgr = ReferenceManager()
+    mgr = get_manager()
     
     # Force clear cache
-    for k in list(mgr.cache.keys()):
-        if "ruvinga" in k.lower():
-            del mgr.cache[k]
+    mgr.cache.evict_token("ruvinga")
             
     try:
         results = mgr.search_author_works(query)
         print(f"Found {len(results)} results.")
+        
+        # Screen every author of every result against the query in one batch
+        candidates = [split_author(a) for res in results for a in res.authors]
+        flags = iter(names_match_batch(first, last, candidates))
         for res in results:
-            print(f" - {res.title} (Authors: {res.authors})")
+            matched = any([next(flags) for _ in res.authors])
+            marker = "" if matched else "  >>> no author matches query"
+            print(f" - {res.title} (Authors: {res.authors}){marker}")
     except Exception as e:
         print(f"Search failed: {e}")
 
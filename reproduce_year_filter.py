@@ -1,8 +1,11 @@
 from src.reference_manager import ReferenceManager
 import logging
+import re
 
 logging.basicConfig(level=logging.INFO)
 
+_YEAR_RE = re.compile(r'\d{4}')
+
 def test_year_filtering():
     mgr = ReferenceManager()
     query = "machine learning"
@@ -38,8 +41,7 @@ def test_year_filtering():
         
         # Check validity
         try:
-            import re
-            match = re.search(r'\d{4}', str(year))
+            match = _YEAR_RE.search(str(year))
             if match:
                 y = int(match.group(0))
                 if y < year_from or y > year_to:
@@ -1,47 +1,85 @@
-import requests
+import asyncio
 import json
 import os
 
+import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Config from existing setup if possible, otherwise use public access
 # (Google Books works without key for rate-limited public data)
+GOOGLE_BOOKS_URL = "https://www.googleapis.com/books/v1/volumes"
+MAX_RESULTS = 3
 
-def debug_google_books_raw(query):
-    print(f"--- Querying Google Books for: {query} ---")
-    url = "https://www.googleapis.com/books/v1/volumes"
+async def fetch_google_books_raw(session, query):
     params = {
         "q": query,
-        "maxResults": 3
+        "maxResults": MAX_RESULTS
     }
-    
-    try:
-        resp = requests.get(url, params=params, timeout=10)
+    async with session.get(GOOGLE_BOOKS_URL, params=params) as resp:
         resp.raise_for_status()
-        data = resp.json()
-        
-        items = data.get("items", [])
-        print(f"Found {len(items)} items.\n")
-        
-        for i, item in enumerate(items):
-            v_info = item.get("volumeInfo", {})
-            print(f"Item #{i+1}:")
-            print(f"  Title: {v_info.get('title')}")
-            print(f"  Authors: {v_info.get('authors')}")
-            print(f"  Publisher: {v_info.get('publisher')}")
-            print(f"  PublishedDate: {v_info.get('publishedDate')}")
-            
-            # Check for industryIdentifiers (ISBNs)
-            print(f"  IndustryIdentifiers: {v_info.get('industryIdentifiers')}")
-            
-            # Check for generic selfLink or infoLink
-            print(f"  InfoLink: {v_info.get('infoLink')}")
-            
-            # Print entire raw volumeInfo for deep inspection
-            print("  [RAW volumeInfo DUMP below]")
+        if ijson is not None:
+            # Only the items are printed, so parse them straight off the
+            # socket and stop reading once enough have arrived.
+            items = []
+            async for item in ijson.items(resp.content, "items.item", use_float=True):
+                items.append(item)
+                if len(items) == MAX_RESULTS:
+                    break
+            return {"items": items}
+        body = await resp.read()
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+def print_google_books_raw(data):
+    items = data.get("items", [])
+    print(f"Found {len(items)} items.\n")
+
+    for i, item in enumerate(items):
+        v_info = item.get("volumeInfo", {})
+        print(f"Item #{i+1}:")
+        print(f"  Title: {v_info.get('title')}")
+        print(f"  Authors: {v_info.get('authors')}")
+        print(f"  Publisher: {v_info.get('publisher')}")
+        print(f"  PublishedDate: {v_info.get('publishedDate')}")
+
+        # Check for industryIdentifiers (ISBNs)
+        print(f"  IndustryIdentifiers: {v_info.get('industryIdentifiers')}")
+
+        # Check for generic selfLink or infoLink
+        print(f"  InfoLink: {v_info.get('infoLink')}")
+
+        # Print entire raw volumeInfo for deep inspection
+        print("  [RAW volumeInfo DUMP below]")
+        if orjson is not None:
+            print(orjson.dumps(v_info, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode())
+        else:
             print(json.dumps(v_info, indent=2))
-            print("-" * 40)
-            
-    except Exception as e:
-        print(f"Error: {e}")
+        print("-" * 40)
+
+async def debug_google_books_raw(queries):
+    # One session for every query so the connection to googleapis.com is
+    # reused, and all requests are in flight at once.
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
+        results = await asyncio.gather(
+            *(fetch_google_books_raw(session, q) for q in queries),
+            return_exceptions=True
+        )
+
+    # Report in query order regardless of which response arrived first
+    for query, result in zip(queries, results):
+        print(f"--- Querying Google Books for: {query} ---")
+        if isinstance(result, Exception):
+            print(f"Error: {result}")
+        else:
+            print_google_books_raw(result)
 
 if __name__ == "__main__":
     queries = [
@@ -49,5 +87,4 @@ if __name__ == "__main__":
         "intitle:Tambaoga mwanangu",
         "Tambaoga mwanangu+inauthor:Kuimba"
     ]
-    for q in queries:
-        debug_google_books_raw(q)
+    asyncio.run(debug_google_books_raw(queries))
@@ -13,6 +13,16 @@ setup(
         "flask>=2.0.0",
         "python-dotenv>=0.19.0",
     ],
+    extras_require={
+        "speedups": [
+            "aiodns>=3.0.0",
+            "Brotli>=1.0.9",
+        ],
+        "cache": [
+            "requests-cache>=1.0.0",
+            "aiohttp-client-cache>=0.10.0",
+        ],
+    },
     python_requires=">=3.8",
     author="Stenford Ruvinga",
     author_email="stenford41@hotmail.com",
@@ -1,7 +1,18 @@
 """Citation and reference formatting utilities."""
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import List, Optional
 from .models import Publication
 
+# Every Publication field read by CitationFormatter._harvard_reference; the
+# values form the cache key for formatted Harvard entries.
+_HARVARD_FIELDS = (
+    "pub_type", "authors", "normalized_authors", "year", "year_status",
+    "title", "journal", "publisher", "location", "volume", "issue", "pages",
+    "doi", "url", "access_date", "editor",
+    "conference_name", "conference_location", "conference_date",
+)
+
 def format_harvard_authors(authors: List[str]) -> str:
     """Format author list in Harvard style."""
     if not authors:
@@ -89,7 +100,15 @@ class CitationFormatter:
                  is_article = True
 
         if style == "harvard":
-            return CitationFormatter._harvard_reference(pub, is_article)
+            key = tuple(
+                tuple(v) if isinstance(v, list) else v
+                for v in (getattr(pub, f, None) for f in _HARVARD_FIELDS)
+            )
+            try:
+                return _cached_harvard_reference(key, is_article)
+            except TypeError:
+                # Unhashable field value; format without caching
+                return CitationFormatter._harvard_reference(pub, is_article)
         if style == "apa":
             return CitationFormatter._apa_reference(pub, is_article)
         if style == "ieee":
@@ -266,4 +285,15 @@ class CitationFormatter:
         else:
             pub = ref_data
             
-        return CitationFormatter.reference_entry(pub, style)
\ No newline at end of file
+        return CitationFormatter.reference_entry(pub, style)
+
+
+@lru_cache(maxsize=4096)
+def _cached_harvard_reference(key: tuple, is_article: bool) -> str:
+    """Format a Harvard entry from a ``_HARVARD_FIELDS`` value tuple.
+
+    Publications are mutable and unhashable, so the entry is cached on the
+    field values instead; re-formatting the same reference is a dict lookup.
+    """
+    pub = SimpleNamespace(**dict(zip(_HARVARD_FIELDS, key)))
+    return CitationFormatter._harvard_reference(pub, is_article)
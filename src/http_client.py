@@ -0,0 +1,22 @@
+"""Shared HTTP session for one-off API lookups."""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _create_session() -> requests.Session:
+    """Create a pooled session that retries dropped connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Keeps connections to each host alive between calls, so repeat lookups skip
+# the TCP and TLS handshakes. requests already asks for gzip/deflate.
+SESSION = _create_session()
@@ -0,0 +1,72 @@
+"""Streaming paragraph reader for .docx files.
+
+Yields the same text as ``[p.text for p in docx.Document(src).paragraphs]``
+without building python-docx's object model for the whole document.
+"""
+import zipfile
+from typing import IO, Iterator, Union
+
+from lxml import etree
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_P = f"{W_NS}p"
+W_R = f"{W_NS}r"
+W_BODY = f"{W_NS}body"
+W_HYPERLINK = f"{W_NS}hyperlink"
+W_TYPE = f"{W_NS}type"
+
+# Run children that carry text, mirroring python-docx's ``CT_R.text``.
+# ``w:br`` is handled separately since only text-wrapping breaks count.
+_RUN_TEXT = {
+    f"{W_NS}t": None,
+    f"{W_NS}tab": "\t",
+    f"{W_NS}ptab": "\t",
+    f"{W_NS}cr": "\n",
+    f"{W_NS}noBreakHyphen": "-",
+}
+W_BR = f"{W_NS}br"
+
+
+def _run_text(run) -> str:
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag in _RUN_TEXT:
+            text = _RUN_TEXT[tag]
+            parts.append((child.text or "") if text is None else text)
+        elif tag == W_BR and child.get(W_TYPE, "textWrapping") == "textWrapping":
+            parts.append("\n")
+    return "".join(parts)
+
+
+def paragraph_text(p) -> str:
+    """Text of a ``w:p`` element, including the runs inside hyperlinks."""
+    parts = []
+    for child in p:
+        if child.tag == W_R:
+            parts.append(_run_text(child))
+        elif child.tag == W_HYPERLINK:
+            parts.extend(_run_text(r) for r in child if r.tag == W_R)
+    return "".join(parts)
+
+
+def iter_paragraphs(source: Union[str, IO[bytes]]) -> Iterator[str]:
+    """
+    Yield the text of each body-level paragraph in a .docx file.
+
+    Args:
+        source: Path to the .docx file or a binary file-like object.
+
+    Paragraphs nested in tables or text boxes are skipped, matching
+    ``Document.paragraphs``. Each paragraph is released once yielded, so
+    memory stays flat regardless of document size.
+    """
+    with zipfile.ZipFile(source) as z, z.open("word/document.xml") as stream:
+        for _, p in etree.iterparse(stream, events=("end",), tag=W_P, huge_tree=True):
+            parent = p.getparent()
+            if parent is not None and parent.tag == W_BODY:
+                yield paragraph_text(p)
+                p.clear()
+                # Drop the finished siblings (paragraphs, tables) before this one
+                while p.getprevious() is not None:
+                    del parent[0]
@@ -2,11 +2,15 @@
 import re
 from io import BytesIO
 from typing import List, Union
-from docx import Document
 
 from .base import ReferenceImporter
+from .docx_fast import iter_paragraphs
 from ..models import Publication
 
+# Patterns applied to every paragraph, compiled once at import
+EDITION_PATTERN = re.compile(r'(\d+(?:st|nd|rd|th)\s+edn?\.?)', re.IGNORECASE)
+COLLECTION_PATTERN = re.compile(r'([A-Z][A-Za-z\s]+(?:Online|Library|Collection))\s*\[Online\]', re.IGNORECASE)
+
 class DocxImporter(ReferenceImporter):
     """Importer for Microsoft Word .docx files."""
     
@@ -38,7 +42,7 @@ class DocxImporter(ReferenceImporter):
             stream = content
             
         try:
-            doc = Document(stream)
+            paragraphs = list(iter_paragraphs(stream))
         except Exception as e:
             # Not a valid docx
             return []
@@ -51,8 +55,8 @@ class DocxImporter(ReferenceImporter):
         type_tag_pattern = re.compile(r"\[(Photograph|Instagram|Online image|Video|Audio)\]", re.IGNORECASE)
         pages_pattern = re.compile(r"pp\.\s*(\d+[-–]\d+)")
 
-        for para in doc.paragraphs:
-            text = para.text.strip()
+        for text in paragraphs:
+            text = text.strip()
             if not text:
                 continue
             
@@ -146,13 +150,11 @@ class DocxImporter(ReferenceImporter):
             pages = pages_match.group(1) if pages_match else ""
             
             # Edition (e.g., "4th edn.", "2nd edition")
-            edition_pattern = re.compile(r'(\d+(?:st|nd|rd|th)\s+edn?\.?)', re.IGNORECASE)
-            edition_match = edition_pattern.search(text)
+            edition_match = EDITION_PATTERN.search(text)
             edition = edition_match.group(1) if edition_match else ""
             
             # Collection (e.g., "Safari Books Online [Online]", "ACM Digital Library [Online]")
-            collection_pattern = re.compile(r'([A-Z][A-Za-z\s]+(?:Online|Library|Collection))\s*\[Online\]', re.IGNORECASE)
-            collection_match = collection_pattern.search(text)
+            collection_match = COLLECTION_PATTERN.search(text)
             collection = collection_match.group(1).strip() if collection_match else ""
 
             # Type Heuristics
@@ -3,7 +3,13 @@ Name parsing and matching utilities.
 """
 import unicodedata
 from difflib import SequenceMatcher
-from typing import Tuple
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    process = None
 
 def normalize_for_comparison(text: str) -> str:
     """
@@ -49,18 +55,21 @@ def looks_like_initial(token: str) -> bool:
     t = token.strip().replace(".", "")
     return len(t) == 1 and t.isalpha()
 
+# common particles in multi-word surnames
+_SURNAME_PARTICLES = frozenset({
+    "van", "von", "der", "den", "ter", "ten",
+    "de", "del", "della", "di", "da", "dos", "du",
+    "la", "le", "lo", "las", "los"
+})
+
+# Pure function of the query string, and the same query is parsed once per
+# source during a search, so results are memoised.
+@lru_cache(maxsize=4096)
 def guess_first_last_from_author_query(author_name: str) -> Tuple[str, str]:
     # Split on whitespace but preserve hyphens within words (e.g., "Smith-Jones" stays as one token)
     parts = author_name.strip().split()
     n = len(parts)
 
-    # common particles in multi-word surnames
-    particles = {
-        "van", "von", "der", "den", "ter", "ten",
-        "de", "del", "della", "di", "da", "dos", "du",
-        "la", "le", "lo", "las", "los"
-    }
-
     if n == 0:
         return "", ""
 
@@ -91,7 +100,7 @@ def guess_first_last_from_author_query(author_name: str) -> Tuple[str, str]:
     i -= 1
     while i >= 0:
         token = parts[i]
-        if token.lower() in particles or token.islower():
+        if token.lower() in _SURNAME_PARTICLES or token.islower():
             surname_tokens_rev.append(token)
             i -= 1
         else:
@@ -146,3 +155,64 @@ def names_match(target_first: str, target_last: str, author_given: str, author_f
         return True
 
     return False
+
+
+def similar_to_many(query: str, choices: Sequence[str], threshold: float = 0.85) -> List[bool]:
+    """
+    Batch form of ``c == query or strings_similar(c, query, threshold)``.
+    
+    When rapidfuzz is installed, all choices are scored against the query in a
+    single C-level pass. Its Indel ratio is never lower than SequenceMatcher's
+    ratio, so it can only discard pairs that strings_similar would reject;
+    survivors are confirmed with strings_similar so results are identical.
+    """
+    if process is None:
+        return [c == query or strings_similar(c, query, threshold) for c in choices]
+
+    flags = [c == query for c in choices]
+    if not query:
+        return flags
+    # Small margin so float rounding in the 0-100 score never drops a borderline pair
+    cutoff = threshold * 100 - 0.01
+    for choice, _, idx in process.extract(
+        query, choices, scorer=fuzz.ratio, processor=None, score_cutoff=cutoff, limit=None
+    ):
+        if not flags[idx]:
+            flags[idx] = strings_similar(choice, query, threshold)
+    return flags
+
+def names_match_batch(
+    target_first: str,
+    target_last: str,
+    candidates: Sequence[Tuple[str, str]]
+) -> List[bool]:
+    """
+    Apply names_match to many (author_given, author_family) pairs at once.
+    
+    The target is normalized once and surnames are screened together via
+    similar_to_many, instead of normalizing and fuzzy-comparing per pair.
+    
+    Returns:
+        One bool per candidate, equal to names_match(target_first, target_last, given, family)
+    """
+    tf = normalize_for_comparison(target_first or "")
+    tl = normalize_for_comparison(target_last or "")
+    families = [normalize_for_comparison(family or "") for _, family in candidates]
+    surname_flags = similar_to_many(tl, families, threshold=0.85)
+    surname_only = (tf == "" or tf == tl)
+
+    results = []
+    for (given, family), surname_matches in zip(candidates, surname_flags):
+        if not family or not surname_matches:
+            results.append(False)
+            continue
+        if surname_only:
+            results.append(True)
+            continue
+        ag = normalize_for_comparison(given or "")
+        results.append(
+            ag.startswith(tf)
+            or strings_similar(ag, tf, threshold=0.85)
+            or (len(tf) == 1 and ag[:1] == tf[:1])
+        )
+    return results
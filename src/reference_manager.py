@@ -20,13 +20,38 @@ from fuzzywuzzy import fuzz
 
 import requests
 import re
+import threading
 from docx import Document
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+except ImportError:
+    rf_process = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_YEAR_RE = re.compile(r'\d{4}')
+
+# Result batch sizes whose pairwise title scores are computed up front.
+# Smaller batches are cheaper to prefilter per title; beyond the upper bound
+# the N x N score matrix gets too large to hold.
+TITLE_MATRIX_MIN = 500
+TITLE_MATRIX_MAX = 2000
+
 from .api import CrossRefAPI, GoogleBooksAPI, PubMedAPI
 from .config import Config
 from .models import Publication
 from .project_manager import ProjectManager, ProjectNotFoundError
 from .utils.input_validation import InputValidator
+from .utils.cache_index import TokenIndexedCache
 from .utils.logging_setup import setup_logging, log_operation
 from .style.reporter import HarvardComplianceReporter
 from .style.remediation import RemediationGenerator
@@ -237,17 +262,25 @@ class ReferenceManager:
         self._project_manager.load()
     
     @property
-    def cache(self) -> Dict:
-        """Lazy load cache in a thread-safe manner."""
+    def cache(self) -> TokenIndexedCache:
+        """
+        Lazy load cache in a thread-safe manner.
+        
+        The cache is a dict indexed by query token, so entries for a name or
+        term can be located via cache.keys_for_token() / evicted via
+        cache.evict_token() without scanning every key.
+        """
         if self._cache is None:
             with self._cache_lock:
                 if self._cache is None:
-                    self._cache = self._load_cache()
+                    self._cache = TokenIndexedCache(self._load_cache())
         return self._cache
 
     @cache.setter
     def cache(self, value):
         with self._cache_lock:
+            if value is not None and not isinstance(value, TokenIndexedCache):
+                value = TokenIndexedCache(value)
             self._cache = value
         
     # Delegate action methods to the actions instance
@@ -401,6 +434,9 @@ class ReferenceManager:
         """Load cache from file."""
         if os.path.exists(self.config.CACHE_FILE):
             try:
+                if orjson is not None:
+                    with open(self.config.CACHE_FILE, "rb") as f:
+                        return orjson.loads(f.read())
                 with open(self.config.CACHE_FILE, "r", encoding="utf-8") as f:
                     return json.load(f)
             except Exception as e:
@@ -412,7 +448,6 @@ class ReferenceManager:
         """Save cache to file atomically."""
         import copy
         import tempfile
-        import shutil
         
         try:
             from dataclasses import asdict, is_dataclass
@@ -430,16 +465,41 @@ class ReferenceManager:
                 # Note: copy.deepcopy can be expensive but ensures snapshot consistency
                 cache_snapshot = copy.deepcopy(self.cache)
                 
-                # Write to temporary file first
+                # Serialize with orjson when available. Dataclasses are passed
+                # through to asdict() like the json path, so dynamic attributes
+                # (e.g. author_ambiguity) are left out and both paths write the
+                # same file.
+                if orjson is not None:
+                    def as_json_dict(o):
+                        if is_dataclass(o):
+                            return asdict(o)
+                        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+                    
+                    payload = orjson.dumps(
+                        cache_snapshot,
+                        default=as_json_dict,
+                        option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                                | orjson.OPT_PASSTHROUGH_DATACLASS)
+                    )
+                else:
+                    payload = json.dumps(
+                        cache_snapshot, indent=2, ensure_ascii=False, cls=EnhancedJSONEncoder
+                    ).encode("utf-8")
+                
+                # Write to a temporary file in the cache's own directory so the
+                # final os.replace is an atomic rename on the same filesystem.
                 # Use delete=False so we can rename it later (Windows requirement for atomic replace)
-                with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False) as tf:
-                    json.dump(cache_snapshot, tf, indent=2, ensure_ascii=False, cls=EnhancedJSONEncoder)
+                cache_dir = os.path.dirname(os.path.abspath(self.config.CACHE_FILE))
+                with tempfile.NamedTemporaryFile(
+                    mode='wb', dir=cache_dir, suffix='.tmp', delete=False
+                ) as tf:
+                    temp_path = tf.name
+                    tf.write(payload)
                     tf.flush()
                     os.fsync(tf.fileno()) # Force write to disk
-                    temp_path = tf.name
                 
                 # Atomic replace
-                shutil.move(temp_path, self.config.CACHE_FILE)
+                os.replace(temp_path, self.config.CACHE_FILE)
                     
         except Exception as e:
             logging.error(f"Error saving cache: {e}")
@@ -684,7 +744,7 @@ class ReferenceManager:
                 if match_found:
                     filtered_works.append(work)
                 else:
-                    logging.debug(f"Filtered out result '{work.title}' - no match for author {author}")
+                    logging.debug("Filtered out result '%s' - no match for author %s", work.title, author)
             
             
                 
@@ -738,6 +798,27 @@ class ReferenceManager:
             logging.error(f"Error searching for author works: {e}")
             return []
 
+    def search_author_works_columns(self, author: str, **kwargs) -> Dict[str, list]:
+        """
+        Search for works by an author and return the results column-wise.
+        
+        Each key maps to one list with an entry per result, in rank order:
+        ``source``, ``title``, ``authors`` (list of author strings) and
+        ``year`` (first four-digit year as an int, or None). Filter passes
+        can then scan a single column of ready-parsed values.
+        """
+        works = self.search_author_works(author, **kwargs)
+        years = []
+        for pub in works:
+            match = _YEAR_RE.search(str(pub.year or ''))
+            years.append(int(match.group(0)) if match else None)
+        return {
+            'source': [pub.source for pub in works],
+            'title': [pub.title for pub in works],
+            'authors': [list(pub.authors or []) for pub in works],
+            'year': years,
+        }
+
     def export_bibtex(self, project_id: str = "default") -> str:
         """
         Export project references to BibTeX format.
@@ -790,25 +871,40 @@ class ReferenceManager:
         """Remove duplicate publications based on DOI and title similarity, merging metadata."""
         seen_dois = {} # Map DOI -> existing_pub
         seen_titles = {} # Map normalized_title -> existing_pub
+        seen_title_list = [] # Keys of seen_titles in insertion order
         unique_results = []
+        title_keys = [pub.title.lower().strip() for pub in results]
+        title_matches = self._title_match_matrix(title_keys)
+        if title_matches is not None:
+            seen_mask = np.zeros(len(results), dtype=bool)
         
-        for pub in results:
+        for i, pub in enumerate(results):
             # 1. Check DOI (most reliable)
             existing_match = None
+            doi_normalized = pub.doi.lower().strip() if pub.doi else ""
+            title_normalized = title_keys[i]
             
-            if pub.doi:
-                doi_normalized = pub.doi.lower().strip()
-                if doi_normalized in seen_dois:
-                    logging.debug(f"Merge candidate (DOI): {doi_normalized}")
-                    existing_match = seen_dois[doi_normalized]
+            if doi_normalized in seen_dois:
+                logging.debug("Merge candidate (DOI): %s", doi_normalized)
+                existing_match = seen_dois[doi_normalized]
             
             # 2. Check title similarity if no DOI match found
             if not existing_match:
-                title_normalized = pub.title.lower().strip()
-                for seen_title, seen_pub in seen_titles.items():
+                if title_normalized and title_matches is not None:
+                    # Seen titles were added in result order, so the matching
+                    # indices come back in insertion order
+                    candidates = [title_keys[j] for j in np.flatnonzero(title_matches[i] & seen_mask)]
+                elif title_normalized:
+                    candidates = self._title_candidates(title_normalized, seen_title_list)
+                else:
+                    # fuzz.ratio scores an empty title 0 against anything but
+                    # another empty title, so a lookup replaces the scan
+                    candidates = [title_normalized] if title_normalized in seen_titles else []
+                for seen_title in candidates:
                     similarity = fuzz.ratio(title_normalized, seen_title)
                     if similarity > 90:  # 90% similar = duplicate
-                        logging.debug(f"Merge candidate (Title): {pub.title[:30]}... matches {seen_pub.title[:30]}...")
+                        seen_pub = seen_titles[seen_title]
+                        logging.debug("Merge candidate (Title): %.30s... matches %.30s...", pub.title, seen_pub.title)
                         existing_match = seen_pub
                         break
             
@@ -820,12 +916,53 @@ class ReferenceManager:
                 unique_results.append(pub)
                 
                 # Update lookups
-                if pub.doi:
-                    seen_dois[pub.doi.lower().strip()] = pub
-                seen_titles[pub.title.lower().strip()] = pub
+                if doi_normalized:
+                    seen_dois[doi_normalized] = pub
+                if title_normalized not in seen_titles:
+                    seen_title_list.append(title_normalized)
+                    if title_matches is not None:
+                        seen_mask[i] = True
+                seen_titles[title_normalized] = pub
         
         return unique_results
 
+    @staticmethod
+    def _title_match_matrix(titles: List[str]):
+        """
+        Flag every pair of ``titles`` that could score above 90, in one batch.
+        
+        Returns an N x N boolean array from ``rapidfuzz.process.cdist``, or
+        None when rapidfuzz/numpy are missing or the batch size is outside
+        ``TITLE_MATRIX_MIN``..``TITLE_MATRIX_MAX``, in which case
+        ``_title_candidates`` is used per title.
+        """
+        if rf_process is None or np is None or not TITLE_MATRIX_MIN <= len(titles) <= TITLE_MATRIX_MAX:
+            return None
+        # Same cutoff as _title_candidates; anything below it scores 0
+        scores = rf_process.cdist(
+            titles, titles, scorer=rf_fuzz.ratio, processor=None,
+            score_cutoff=90.49, workers=-1
+        )
+        return scores > 0
+
+    @staticmethod
+    def _title_candidates(title: str, seen_titles: List[str]) -> List[str]:
+        """
+        Narrow seen titles to those that could score above 90 against ``title``.
+        
+        rapidfuzz scores the whole list in one C-level pass. Its ratio is never
+        below fuzzywuzzy's, so no real match is dropped; survivors keep their
+        insertion order and are still confirmed with fuzzywuzzy by the caller.
+        """
+        if rf_process is None or not title:
+            return seen_titles
+        # fuzzywuzzy rounds to an int, so anything scoring above 90 is >= 90.5
+        matches = rf_process.extract(
+            title, seen_titles, scorer=rf_fuzz.ratio, processor=None,
+            score_cutoff=90.49, limit=None
+        )
+        return [seen_titles[idx] for idx in sorted(idx for _, _, idx in matches)]
+
     def _merge_metadata(self, target: Publication, source: Publication):
         """Merge metadata from source into target if missing in target."""
         # Merge key fields if target is empty/generic but source has data
@@ -1109,7 +1246,7 @@ class ReferenceManager:
                     # Relaxed threshold from 60 to 45 to allow legitimate matches with slight variations
                     if score < 45:
                         should_drop = True
-                        logging.debug(f"Dropped strict title result (score={score}): {pub.title}")
+                        logging.debug("Dropped strict title result (score=%s): %s", score, pub.title)
                 else:
                      # Drop low fuzzy matches or keyword-only matches in strict title mode
                      # BUT keep if we have strong keyword proximity signal
@@ -1117,12 +1254,13 @@ class ReferenceManager:
                          pass
                      else:
                         should_drop = True
-                        logging.debug(f"Dropped strict title result (no strong title match): {pub.title}")
+                        logging.debug("Dropped strict title result (no strong title match): %s", pub.title)
 
             if not should_drop:
                 best_pubs.append(pub)
             else:
-                logging.debug(f"Dropped noise result (score={score}, overlap={overlap_count}, edu_mismatch={query_has_edu_phrase and not title_has_edu_phrase}): {pub.title[:30]}...")
+                logging.debug("Dropped noise result (score=%s, overlap=%s, edu_mismatch=%s): %.30s...",
+                              score, overlap_count, query_has_edu_phrase and not title_has_edu_phrase, pub.title)
         
         # Re-sort final list to ensure demotions (if any logic added for that) or just stable score sort
         # Currently the list is built in score order.
@@ -1131,14 +1269,16 @@ class ReferenceManager:
         # The key is we didn't drop them.
         
         if best_pubs:
-            logging.debug(f"Top result (score={scored_results[0][0]}, conf={best_pubs[0].confidence_score:.2f}): {best_pubs[0].title[:50]}...")
+            logging.debug("Top result (score=%s, conf=%.2f): %.50s...",
+                          scored_results[0][0], best_pubs[0].confidence_score, best_pubs[0].title)
             if hasattr(best_pubs[0], 'selection_details'):
-                logging.debug(f"Selection details: {best_pubs[0].selection_details}")
+                logging.debug("Selection details: %s", best_pubs[0].selection_details)
         
         if best_pubs:
-            logging.debug(f"Top result (score={scored_results[0][0]}, conf={best_pubs[0].confidence_score:.2f}): {best_pubs[0].title[:50]}...")
+            logging.debug("Top result (score=%s, conf=%.2f): %.50s...",
+                          scored_results[0][0], best_pubs[0].confidence_score, best_pubs[0].title)
             if hasattr(best_pubs[0], 'selection_details'):
-                logging.debug(f"Selection details: {best_pubs[0].selection_details}")
+                logging.debug("Selection details: %s", best_pubs[0].selection_details)
         
         return best_pubs
         
@@ -1356,3 +1496,21 @@ class ReferenceManager:
             logging.error(f"Enrichment failed: {e}")
             return pub
 
+
+# Process-wide manager shared by scripts and the referencing facade
+_manager: Optional[ReferenceManager] = None
+_manager_lock = threading.Lock()
+
+def get_manager() -> ReferenceManager:
+    """
+    Return the shared ReferenceManager, creating it on first use.
+    
+    Constructing a manager loads the search cache from disk, so scripts that
+    only need one should call this rather than ``ReferenceManager()``.
+    """
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = ReferenceManager()
+    return _manager
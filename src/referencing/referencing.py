@@ -22,32 +22,25 @@ from typing import List, Dict, Set, Optional, Tuple, Any, Union, cast, Callable,
 from docx import Document
 from dataclasses import asdict, is_dataclass
 
-# Import ReferenceManager for consolidation
+# Shared ReferenceManager (and pooled HTTP session) for consolidation
 try:
-    from src.reference_manager import ReferenceManager
+    from src.reference_manager import get_manager
+    from src.http_client import SESSION as HTTP_SESSION
 except ImportError:
     try:
         # Fallback for relative import if src is not package root
-        from ..reference_manager import ReferenceManager
+        from ..reference_manager import get_manager
+        from ..http_client import SESSION as HTTP_SESSION
     except ImportError:
         # Fallback for when running script directly/path issues
         import sys
         sys.path.append(str(Path(__file__).parent.parent))
-        from reference_manager import ReferenceManager
-
-import threading
-
-# Singleton manager instance
-_manager = None
-_manager_lock = threading.Lock()
+        from reference_manager import get_manager
+        from http_client import SESSION as HTTP_SESSION
 
 def _get_manager():
-    global _manager
-    if _manager is None:
-        with _manager_lock:
-            if _manager is None:
-                _manager = ReferenceManager()
-    return _manager
+    """Return the process-wide ReferenceManager (created on first use)."""
+    return get_manager()
 
 # API Configuration
 COLLEGE_CATALOG_API_URL = "http://127.0.0.1:8000"  # URL for the local college catalog API
@@ -700,7 +693,7 @@ def search_semantic_scholar_single(query_text: str, limit: int = 5) -> Optional[
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = HTTP_SESSION.get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
         
@@ -774,7 +767,7 @@ def search_college_catalog(query_text: str, max_results: int = 5) -> Optional[Li
             'per_page': max_results
         }
         
-        response = requests.get(
+        response = HTTP_SESSION.get(
             f"{COLLEGE_CATALOG_API_URL}/search",
             params=params,
             timeout=10
@@ -833,7 +826,7 @@ def search_arxiv_single(query_text: str, max_results: int = 5) -> Optional[Dict[
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = HTTP_SESSION.get(url, params=params, timeout=10)
         response.raise_for_status()
         
         # Parse XML response
@@ -0,0 +1,104 @@
+"""Search-result cache with a secondary token index over its keys."""
+import re
+from typing import Dict, Set, Tuple
+
+_TOKEN_RE = re.compile(r"\w+")
+
+def key_tokens(key: str) -> Set[str]:
+    """
+    Lowercased word tokens of a cache key's query part.
+    
+    "author:Ruvinga S" -> {"ruvinga", "s"}
+    """
+    return set(_TOKEN_RE.findall(key.split(":", 1)[-1].lower()))
+
+class TokenIndexedCache(dict):
+    """
+    A dict of cache entries that also maps each query token to the keys
+    containing it, so entries for a given name or term can be found or evicted
+    without scanning every key.
+    
+    All mutating dict methods keep the index in step; reading behaves exactly
+    like a plain dict, and the cache still serializes as one.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._index: Dict[str, Set[str]] = {}
+        for key in self:
+            self._index_key(key)
+    
+    def _index_key(self, key) -> None:
+        if isinstance(key, str):
+            for token in key_tokens(key):
+                self._index.setdefault(token, set()).add(key)
+    
+    def _unindex_key(self, key) -> None:
+        if isinstance(key, str):
+            for token in key_tokens(key):
+                keys = self._index.get(token)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._index[token]
+    
+    def __setitem__(self, key, value) -> None:
+        if key not in self:
+            self._index_key(key)
+        super().__setitem__(key, value)
+    
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._unindex_key(key)
+    
+    def pop(self, key, *default):
+        had_key = key in self
+        value = super().pop(key, *default)
+        if had_key:
+            self._unindex_key(key)
+        return value
+    
+    def popitem(self) -> Tuple:
+        key, value = super().popitem()
+        self._unindex_key(key)
+        return key, value
+    
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self._index_key(key)
+        return super().setdefault(key, default)
+    
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+    
+    def __ior__(self, other):
+        self.update(other)
+        return self
+    
+    def clear(self) -> None:
+        super().clear()
+        self._index.clear()
+    
+    def __reduce__(self):
+        # copy/deepcopy/pickle rebuild through __init__, which re-derives the index
+        return (type(self), (dict(self),))
+    
+    def keys_for_token(self, token: str) -> Set[str]:
+        """Keys whose query contains ``token`` as a whole word (case-insensitive)."""
+        return set(self._index.get(token.lower(), ()))
+    
+    def evict_token(self, token: str) -> int:
+        """
+        Remove every entry whose query contains ``token`` as a whole word.
+        
+        Unlike a ``token in key.lower()`` scan, this does not match inside
+        longer words: evicting "ruvinga" leaves "ruvingas" entries alone.
+        
+        Returns:
+            int: Number of entries removed
+        """
+        keys = self.keys_for_token(token)
+        for key in keys:
+            self.pop(key, None)
+        return len(keys)
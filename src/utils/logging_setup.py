@@ -20,7 +20,7 @@ def setup_logging(log_dir: str = "logs", level: int = logging.INFO) -> None:
     
     # Set up handlers
     handlers = [
-        logging.FileHandler(log_file),
+        logging.FileHandler(log_file, delay=True),  # Opened on first record
         logging.StreamHandler()  # Console output
     ]
     
@@ -32,6 +32,21 @@ class TestCombinedAuthorSearch(unittest.TestCase):
         self.manager.crossref.search_author.assert_called_with("Test Author")
         self.manager.google_books.search_author.assert_called_with("Test Author")
 
+    def test_search_author_works_columns(self):
+        pub1 = Publication(source="crossref", pub_type="article", authors=["Ruvinga, S"], year="2023a", title="Paper 1", journal="Journal", publisher="", location="", volume="", issue="", pages="", doi="")
+        pub2 = Publication(source="google_books", pub_type="book", authors=[], year="n.d.", title="Book 1", journal="", publisher="Publisher", location="", volume="", issue="", pages="", doi="")
+        
+        with patch.object(self.manager, "search_author_works", return_value=[pub1, pub2]) as search:
+            columns = self.manager.search_author_works_columns("Ruvinga S", year_from=2020)
+        
+        search.assert_called_once_with("Ruvinga S", year_from=2020)
+        self.assertEqual(columns, {
+            "source": ["crossref", "google_books"],
+            "title": ["Paper 1", "Book 1"],
+            "authors": [["Ruvinga, S"], []],
+            "year": [2023, None],
+        })
+
 class TestReferencingLookupAuthor(unittest.TestCase):
     @patch('src.referencing.referencing._get_manager')
     def test_lookup_author_works_combines(self, mock_get_manager):
@@ -0,0 +1,50 @@
+"""Tests for the token-indexed search cache."""
+import copy
+import json
+import unittest
+
+from src.utils.cache_index import TokenIndexedCache, key_tokens
+
+class TestTokenIndexedCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = TokenIndexedCache({
+            "author:Ruvinga S": {"data": 1},
+            "query:Stenford Ruvinga thesis": {"data": 2},
+            "query:machine learning": {"data": 3},
+        })
+
+    def test_key_tokens(self):
+        self.assertEqual(key_tokens("author:Ruvinga S"), {"ruvinga", "s"})
+
+    def test_lookup_is_case_insensitive(self):
+        self.assertEqual(
+            self.cache.keys_for_token("RUVINGA"),
+            {"author:Ruvinga S", "query:Stenford Ruvinga thesis"},
+        )
+
+    def test_mutations_keep_index_in_step(self):
+        self.cache["author:ruvinga stenford"] = {"data": 4}
+        self.cache.update({"query:deep learning": {"data": 5}})
+        del self.cache["query:machine learning"]
+        self.cache.pop("author:Ruvinga S")
+
+        self.assertEqual(
+            self.cache.keys_for_token("ruvinga"),
+            {"author:ruvinga stenford", "query:Stenford Ruvinga thesis"},
+        )
+        self.assertEqual(self.cache.keys_for_token("learning"), {"query:deep learning"})
+        self.assertEqual(self.cache.keys_for_token("machine"), set())
+
+    def test_evict_token(self):
+        removed = self.cache.evict_token("ruvinga")
+        self.assertEqual(removed, 2)
+        self.assertEqual(list(self.cache), ["query:machine learning"])
+
+    def test_behaves_like_dict(self):
+        snapshot = copy.deepcopy(self.cache)
+        self.assertIsInstance(snapshot, TokenIndexedCache)
+        self.assertEqual(snapshot.keys_for_token("ruvinga"), self.cache.keys_for_token("ruvinga"))
+        self.assertEqual(json.loads(json.dumps(self.cache)), dict(self.cache))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Tests for saving and reloading the search cache."""
+import os
+import tempfile
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src import reference_manager
+from src.models import Publication
+
+
+def _manager(cache_file):
+    # Only the cache methods are exercised, so skip API/project setup
+    mgr = reference_manager.ReferenceManager.__new__(reference_manager.ReferenceManager)
+    mgr.config = SimpleNamespace(CACHE_FILE=cache_file)
+    mgr._cache = None
+    mgr._cache_lock = threading.RLock()
+    return mgr
+
+
+class TestCachePersistence(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        pub = Publication(
+            source="crossref", pub_type="article", authors=["Müller, J."], year="2020",
+            title="Über Tests", journal="J", publisher="", location="", volume="1",
+            issue="2", pages="3-4", doi="10.1/x"
+        )
+        # Dynamic attribute set by author search; not a dataclass field
+        pub.author_ambiguity = {"note": object()}
+        self.cache = {"query:uber tests": [pub], "author:muller": {"count": 1}}
+
+    def _save(self, name, use_orjson):
+        path = os.path.join(self.tmp.name, name)
+        mgr = _manager(path)
+        mgr.cache = dict(self.cache)
+        if use_orjson:
+            mgr._save_cache()
+        else:
+            with patch.object(reference_manager, "orjson", None):
+                mgr._save_cache()
+        with open(path, "rb") as f:
+            return path, f.read()
+
+    def test_orjson_and_json_write_identical_files(self):
+        if reference_manager.orjson is None:
+            self.skipTest("orjson not installed")
+        _, with_orjson = self._save("orjson.json", True)
+        _, with_json = self._save("json.json", False)
+        self.assertEqual(with_orjson, with_json)
+
+    def test_round_trip(self):
+        for use_orjson in (True, False):
+            if use_orjson and reference_manager.orjson is None:
+                continue
+            path, _ = self._save(f"cache_{use_orjson}.json", use_orjson)
+            loaded = _manager(path).cache
+            entry = loaded["query:uber tests"][0]
+            self.assertEqual(entry["title"], "Über Tests")
+            self.assertNotIn("author_ambiguity", entry)
+            self.assertEqual(loaded["author:muller"], {"count": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Tests for the baseline/enhanced output comparison script."""
+import math
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import compare_outputs
+
+
+def _pub(pub_id, **overrides):
+    pub = {
+        "id": pub_id, "title": "Test Paper", "authors": ["Doe, A"], "year": "2020",
+        "pub_type": "article", "compliance_score": 80.0, "violations": [],
+    }
+    pub.update(overrides)
+    return pub
+
+
+@unittest.skipIf(compare_outputs.pd is None, "pandas not installed")
+class TestChangedFieldMask(unittest.TestCase):
+    def setUp(self):
+        nan = float("nan")
+        self.baseline = [
+            _pub("same"),
+            _pub("authors", authors=["Doe, A"]),
+            _pub("none-vs-nan", compliance_score=None),
+            _pub("nan-vs-none", compliance_score=nan),
+            _pub("missing-vs-none", year=None),
+            _pub("both-none", year=None),
+            _pub("shared-nan", compliance_score=nan),
+            _pub("int-vs-float", compliance_score=80),
+        ]
+        self.enhanced = [
+            _pub("same"),
+            _pub("authors", authors=["Doe, A."]),
+            _pub("none-vs-nan", compliance_score=nan),
+            _pub("nan-vs-none", compliance_score=None),
+            {k: v for k, v in _pub("missing-vs-none").items() if k != "year"},
+            _pub("both-none", year=None),
+            _pub("shared-nan", compliance_score=nan),
+            _pub("int-vs-float", compliance_score=80.0),
+        ]
+        # json.load shares one NaN object, so "shared-nan" compares equal by identity
+        self.enhanced[6]["compliance_score"] = self.baseline[6]["compliance_score"]
+
+    def _report(self):
+        return sorted(
+            compare_outputs.compare_publications(self.baseline, self.enhanced),
+            key=lambda row: (row["PublicationID"], row["Field"]),
+        )
+
+    def test_mask_matches_loop(self):
+        with patch.object(compare_outputs, "pd", None):
+            expected = self._report()
+        with patch.object(compare_outputs, "PANDAS_MIN_ROWS", 0):
+            self.assertIsNotNone(compare_outputs.changed_field_mask(
+                {p["id"]: p for p in self.baseline},
+                {p["id"]: p for p in self.enhanced},
+                ["same"],
+            ))
+            actual = self._report()
+        self.assertEqual(actual, expected)
+        self.assertEqual(
+            {(row["PublicationID"], row["Field"]) for row in expected},
+            {("authors", "authors"), ("none-vs-nan", "compliance_score"),
+             ("nan-vs-none", "compliance_score")},
+        )
+
+    def test_missing_cells_are_flagged(self):
+        base = {p["id"]: p for p in self.baseline}
+        enh = {p["id"]: p for p in self.enhanced}
+        keys = ["same", "none-vs-nan"]
+        with patch.object(compare_outputs, "PANDAS_MIN_ROWS", 0):
+            mask = compare_outputs.changed_field_mask(base, enh, keys)
+        self.assertFalse(mask.iloc[0].any())
+        self.assertTrue(mask.iloc[1]["compliance_score"])
+
+
+class TestJsonBackends(unittest.TestCase):
+    """load_json/dump_json behave the same with and without orjson."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _backends(self):
+        backends = [None]
+        if compare_outputs.orjson is not None:
+            backends.append(compare_outputs.orjson)
+        return backends
+
+    def _write(self, name, data):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_round_trip(self):
+        report = [_pub("1", title="Über Tests"), _pub("2", authors=[], year=None)]
+        for backend in self._backends():
+            with patch.object(compare_outputs, "orjson", backend):
+                path = self._write("report.json", compare_outputs.dump_json(report))
+                self.assertEqual(compare_outputs.load_json(path), report)
+
+    def test_loads_nan_and_infinity(self):
+        path = self._write("nan.json", b'[{"compliance_score": NaN, "x": Infinity}]')
+        for backend in self._backends():
+            with patch.object(compare_outputs, "orjson", backend):
+                loaded = compare_outputs.load_json(path)
+            self.assertTrue(math.isnan(loaded[0]["compliance_score"]))
+            self.assertEqual(loaded[0]["x"], float("inf"))
+
+    def test_invalid_json_returns_none(self):
+        path = self._write("bad.json", b"[{")
+        for backend in self._backends():
+            with patch.object(compare_outputs, "orjson", backend):
+                self.assertIsNone(compare_outputs.load_json(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import pytest
 import uuid
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 from src.importers.docx_importer import DocxImporter
 from src.style.harvard_checker import HarvardStyleChecker
 from src.style.report_generator import HarvardComplianceReportGenerator
@@ -122,11 +122,8 @@ class TestCompliancePipeline:
         
         # Mock content
         mock_text = "Smith, J. (2023) 'Test Title', Journal of Tests, 10(2), pp. 100-110."
-        mock_para = MagicMock()
-        mock_para.text = mock_text
-        
-        with patch('src.importers.docx_importer.Document') as mock_docx:
-            mock_docx.return_value.paragraphs = [mock_para]
+        with patch('src.importers.docx_importer.iter_paragraphs') as mock_iter:
+            mock_iter.return_value = iter([mock_text])
             
             pubs = importer.parse(b"dummy_bytes")
             
@@ -45,6 +45,7 @@ class Publication:
 
 # Mock the module locally
 import types
+_saved_modules = {name: sys.modules.get(name) for name in ("src", "src.models")}
 models_mod = types.ModuleType("src.models")
 models_mod.Publication = Publication
 sys.modules["src.models"] = models_mod
@@ -76,6 +77,13 @@ ns = {"Publication": Publication, "re": __import__("re"), "List": List, "Tuple":
 exec(code, ns)
 ReferenceNormalizer = ns["ReferenceNormalizer"]
 
+# Put the real modules back so later test modules can import from src
+for _name, _module in _saved_modules.items():
+    if _module is None:
+        sys.modules.pop(_name, None)
+    else:
+        sys.modules[_name] = _module
+
 class TestCorporateAuthorDetection(unittest.TestCase):
     
     def normalize(self, authors):
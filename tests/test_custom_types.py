@@ -0,0 +1,36 @@
+"""Tests for the frozen value types in custom_types."""
+import copy
+import pickle
+import unittest
+
+from custom_types import Publication
+
+
+def _publication():
+    return Publication(
+        source="crossref", pub_type="journal-article",
+        authors=("Smith, J.", "Doe, J."), year="2023", title="A Title",
+        journal="Journal of Testing", publisher="", location="", volume="",
+        issue="", pages="", doi="10.1234/test",
+    )
+
+
+class TestValueTypeCopies(unittest.TestCase):
+    def test_copy_and_pickle_round_trip(self):
+        value = _publication()
+        for clone in (
+            copy.copy(value),
+            copy.deepcopy(value),
+            pickle.loads(pickle.dumps(value)),
+        ):
+            self.assertEqual(clone, value)
+            self.assertEqual(hash(clone), hash(value))
+
+    def test_clone_stays_frozen(self):
+        clone = copy.deepcopy(_publication())
+        with self.assertRaises(AttributeError):
+            clone.title = "Changed"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,8 @@
 import unittest
+from unittest.mock import patch
+
+from src import reference_manager
+from src.models import Publication
 from src.referencing.referencing import get_dedupe_key, is_duplicate
 
 class TestDeduplication(unittest.TestCase):
@@ -43,5 +47,67 @@ class TestDeduplication(unittest.TestCase):
         new_diff = {"title": "Different Paper", "authors": "Jones, A.", "year": "2022"}
         self.assertFalse(is_duplicate(new_diff, existing))
 
+
+def _pub(title, doi="", url=""):
+    return Publication(
+        source="crossref", pub_type="book", authors=[], year="2020", title=title,
+        journal="", publisher="", location="", volume="", issue="", pages="",
+        doi=doi, url=url
+    )
+
+
+class TestDeduplicateResults(unittest.TestCase):
+    TITLES = [
+        "Pattern Recognition and Machine Learning",
+        "Pattern Recognition and Machine Learnin",
+        "Pattern Recognition",
+        "pattern recognition and machine learning ",
+        "",
+        "",
+        "Deep Learning",
+        "Deep Learning!",
+        "Deep Learning with Python",
+    ]
+
+    def _dedupe(self):
+        # Only the dedup helpers are exercised, so skip cache/project setup
+        mgr = reference_manager.ReferenceManager.__new__(reference_manager.ReferenceManager)
+        pubs = [_pub(t, url=f"u{i}") for i, t in enumerate(self.TITLES)]
+        return [(p.title, p.url) for p in mgr._deduplicate_results(pubs)]
+
+    def test_title_matches(self):
+        self.assertEqual(self._dedupe(), [
+            ("Pattern Recognition and Machine Learning", "u0"),
+            ("Pattern Recognition", "u2"),
+            ("", "u4"),
+            ("Deep Learning", "u6"),
+            ("Deep Learning with Python", "u8"),
+        ])
+
+    def test_same_result_without_rapidfuzz(self):
+        expected = self._dedupe()
+        with patch.object(reference_manager, "rf_process", None):
+            self.assertEqual(self._dedupe(), expected)
+
+    def test_same_result_with_score_matrix(self):
+        expected = self._dedupe()
+        with patch.object(reference_manager, "TITLE_MATRIX_MIN", 2):
+            self.assertEqual(self._dedupe(), expected)
+
+    def test_doi_match_ignores_title(self):
+        mgr = reference_manager.ReferenceManager.__new__(reference_manager.ReferenceManager)
+        pubs = [
+            _pub("First", doi="10.1/A"),
+            _pub("", doi="10.1/b"),
+            _pub("Unrelated", doi=" 10.1/a", url="u2"),
+            _pub("", doi="10.1/B "),
+            _pub("", url="u4"),
+        ]
+        self.assertEqual(
+            [(p.title, p.doi, p.url) for p in mgr._deduplicate_results(pubs)],
+            [("First", "10.1/A", "u2"), ("", "10.1/b", "u4")]
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,50 @@
+"""Tests for the streaming DOCX paragraph reader."""
+import unittest
+from io import BytesIO
+
+import docx
+from docx.enum.text import WD_BREAK
+from docx.oxml import parse_xml
+
+from src.importers.docx_fast import iter_paragraphs
+from src.importers.docx_importer import DocxImporter
+
+
+def _build_document():
+    doc = docx.Document()
+    doc.add_paragraph("Smith, J. (2023) 'Test Title', Journal of Tests, 10(2), pp. 100-110.")
+    doc.add_paragraph("")
+    run = doc.add_paragraph("Tabbed\tline").add_run(" wrapped")
+    run.add_break()
+    run.add_text("next")
+    run.add_break(WD_BREAK.PAGE)
+    table = doc.add_table(rows=1, cols=1)
+    table.cell(0, 0).text = "Inside a table"
+    p = doc.add_paragraph("See ")
+    p._p.append(parse_xml(
+        '<w:hyperlink xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        '<w:r><w:t>the guide</w:t></w:r></w:hyperlink>'
+    ))
+    doc.add_paragraph("Last paragraph")
+    buf = BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+class TestIterParagraphs(unittest.TestCase):
+    def test_matches_python_docx(self):
+        data = _build_document()
+        expected = [p.text for p in docx.Document(BytesIO(data)).paragraphs]
+        self.assertEqual(list(iter_paragraphs(BytesIO(data))), expected)
+
+    def test_importer_rejects_non_docx(self):
+        self.assertEqual(DocxImporter().parse(b"not a zip file"), [])
+
+    def test_importer_parses_reference(self):
+        pubs = DocxImporter().parse(_build_document())
+        self.assertEqual(len(pubs), 1)
+        self.assertEqual(pubs[0].title, "Test Title")
+
+
+if __name__ == "__main__":
+    unittest.main()
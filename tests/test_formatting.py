@@ -0,0 +1,44 @@
+"""Tests for CitationFormatter reference entries."""
+import unittest
+
+from src.formatting import CitationFormatter
+from src.models import Publication
+
+
+def _article(**overrides):
+    fields = dict(
+        source="crossref", pub_type="journal-article",
+        authors=["Smith, J.", "Doe, J."], year="2023", title="A Title",
+        journal="Journal of Testing", publisher="", location="",
+        volume="12", issue="3", pages="1-10", doi="10.1234/test",
+    )
+    fields.update(overrides)
+    return Publication(**fields)
+
+
+class TestHarvardReferenceCache(unittest.TestCase):
+    def test_equal_publications_share_entry(self):
+        self.assertEqual(
+            CitationFormatter.reference_entry(_article(), "harvard"),
+            "Smith, J. and Doe, J. (2023) 'A Title', Journal of Testing, 12(3), pp. 1-10. doi:10.1234/test"
+        )
+        self.assertEqual(
+            CitationFormatter.reference_entry(_article(), "harvard"),
+            CitationFormatter.reference_entry(_article(), "harvard")
+        )
+
+    def test_mutation_after_formatting(self):
+        pub = _article()
+        first = CitationFormatter.reference_entry(pub, "harvard")
+        pub.normalized_authors = ["Zed, Z."]
+        pub.year_status = "explicitly_undated"
+        self.assertTrue(
+            CitationFormatter.reference_entry(pub, "harvard").startswith("Zed, Z. (n.d.)")
+        )
+        pub.normalized_authors = []
+        pub.year_status = "present"
+        self.assertEqual(CitationFormatter.reference_entry(pub, "harvard"), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
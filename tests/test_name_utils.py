@@ -0,0 +1,49 @@
+"""Tests for batch author-name matching."""
+import unittest
+from unittest.mock import patch
+
+from src import name_utils
+from src.name_utils import names_match, names_match_batch
+
+CANDIDATES = [
+    ("Stenford", "Ruvinga"),
+    ("S.", "Ruvinga"),
+    ("Stenford", "Ruvingo"),
+    ("John", "Smith"),
+    ("J", "Smyth"),
+    ("José", "García"),
+    ("Jose", "Garcia"),
+    ("Christopher", "Christoper"),
+    ("Anne", ""),
+    ("", "Ruvinga"),
+]
+
+TARGETS = [
+    ("Stenford", "Ruvinga"),
+    ("S", "Ruvinga"),
+    ("Ruvinga", "Ruvinga"),
+    ("J", "Smith"),
+    ("Jose", "Garcia"),
+    ("Christopher", "Christopher"),
+    ("", ""),
+]
+
+class TestNamesMatchBatch(unittest.TestCase):
+    def test_matches_per_pair_results(self):
+        """Batch results must agree with names_match for every candidate."""
+        for first, last in TARGETS:
+            expected = [names_match(first, last, g, f) for g, f in CANDIDATES]
+            self.assertEqual(names_match_batch(first, last, CANDIDATES), expected, (first, last))
+
+    def test_matches_without_rapidfuzz(self):
+        """The pure-Python fallback gives the same answers."""
+        with patch.object(name_utils, "process", None):
+            for first, last in TARGETS:
+                expected = [names_match(first, last, g, f) for g, f in CANDIDATES]
+                self.assertEqual(names_match_batch(first, last, CANDIDATES), expected)
+
+    def test_empty_candidates(self):
+        self.assertEqual(names_match_batch("S", "Ruvinga", []), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,11 @@
-from src.reference_manager import ReferenceManager
+from src.reference_manager import get_manager
 from src.models import Publication
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 
-rm = ReferenceManager()
+rm = get_manager()
 
 # Simulate two results for the same book
 # 1. CrossRef result (Good source score, but missing URL/ISBN)
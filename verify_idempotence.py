@@ -1,9 +1,12 @@
 
 import json
-import copy
 from src.models import Publication
 from src.normalizer import ReferenceNormalizer
 
+def _snapshot(p):
+    """Copy just the fields compared below; far cheaper than deep-copying p."""
+    return list(p.normalized_authors or []), p.year, len(p.normalization_log or [])
+
 def verify_idempotence():
     # Test Data: 1 publication that needs normalization
     p = Publication(
@@ -18,36 +21,36 @@ def verify_idempotence():
     
     # Run 1
     ReferenceNormalizer.normalize(p)
-    state_after_1 = copy.deepcopy(p)
+    authors_1, year_1, log_len_1 = _snapshot(p)
     
     # Run 2
     ReferenceNormalizer.normalize(p)
-    state_after_2 = copy.deepcopy(p)
+    authors_2, year_2, log_len_2 = _snapshot(p)
     
     # Compare
     report = []
     
     # Check Authors
-    if state_after_1.normalized_authors != state_after_2.normalized_authors:
+    if authors_1 != authors_2:
         report.append({
             "PublicationID": "Test1",
             "Field": "normalized_authors",
-            "Change": f"{state_after_1.normalized_authors} -> {state_after_2.normalized_authors}",
+            "Change": f"{authors_1} -> {authors_2}",
             "Severity": "high"
         })
         
     # Check Year
-    if state_after_1.year != state_after_2.year:
+    if year_1 != year_2:
         report.append({
             "PublicationID": "Test1",
             "Field": "year",
-            "Change": f"{state_after_1.year} -> {state_after_2.year}",
+            "Change": f"{year_1} -> {year_2}",
             "Severity": "high"
         })
         
     # Check Logs (Should NOT grow if idempotent, unless we log "Already normalized")
     # Actually, if we skip, log shouldn't grow.
-    if len(state_after_1.normalization_log) != len(state_after_2.normalization_log):
+    if log_len_1 != log_len_2:
         # This is expected if we log "Skipping", but we want to know if it DID work again.
         # Ideally, idempotent means result State is same. Log might differ.
         pass
@@ -1,10 +1,10 @@
-from src.reference_manager import ReferenceManager
+from src.reference_manager import get_manager
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
-rm = ReferenceManager()
+rm = get_manager()
 query = "Tambaoga mwanangu"
 
 print(f"--- Searching for '{query}' to verify ISBN extraction ---")
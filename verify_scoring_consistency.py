@@ -1,35 +1,33 @@
 
 import json
-import copy
 from src.reference_manager import ReferenceManager
 from src.style.harvard_checker import HarvardStyleChecker
 from src.style.report_generator import HarvardComplianceReportGenerator
 from src.models import Publication
 
+# Fields shared by every synthetic publication; each group overrides the rest
+_BASE = dict(source="crossref", pub_type="article", journal="", publisher="", location="", volume="", issue="", pages="")
+
+def _pub(title, authors, year, doi):
+    p = Publication(title=title, authors=authors, year=year, doi=doi, **_BASE)
+    p.violations = []
+    return p
+
 def create_dataset():
     pubs = []
     
     # Group A: Identical (Should merge to 1)
     for i in range(20):
-        p = Publication(title="Unique Title A", authors=["Smith"], year="2020", doi="10.1000/A", source="crossref", pub_type="article", journal="", publisher="", location="", volume="", issue="", pages="")
-        p.violations = []
-        pubs.append(p)
+        pubs.append(_pub("Unique Title A", ["Smith"], "2020", "10.1000/A"))
         
     # Group B: Unique (Should be 20)
     for i in range(20):
-        p = Publication(title=f"Unique Title B{i}", authors=["Doe"], year="2020", doi=f"10.1000/B{i}", source="crossref", pub_type="article", journal="", publisher="", location="", volume="", issue="", pages="")
-        p.violations = []
-        pubs.append(p)
+        pubs.append(_pub(f"Unique Title B{i}", ["Doe"], "2020", f"10.1000/B{i}"))
         
     # Group C: Fuzzy (Sim > 90%) (Should merge)
     for i in range(10):
-        p1 = Publication(title="Machine Learning in Health", authors=["Lee"], year="2021", doi=f"10.1000/C{i}", source="crossref", pub_type="article", journal="", publisher="", location="", volume="", issue="", pages="")
-        p1.violations = []
-        pubs.append(p1)
-        
-        p2 = Publication(title="Machine Learning in Health.", authors=["Lee"], year="2021", doi=f"10.1000/C{i}_dup", source="crossref", pub_type="article", journal="", publisher="", location="", volume="", issue="", pages="")
-        p2.violations = []
-        pubs.append(p2)
+        pubs.append(_pub("Machine Learning in Health", ["Lee"], "2021", f"10.1000/C{i}"))
+        pubs.append(_pub("Machine Learning in Health.", ["Lee"], "2021", f"10.1000/C{i}_dup"))
 
     return pubs
 
@@ -38,10 +36,10 @@ def main():
     checker = HarvardStyleChecker()
     generator = HarvardComplianceReportGenerator()
     
-    base_pubs = create_dataset()
-    
+    # Each run gets freshly built publications, since deduplication and
+    # checking mutate them in place
     # Run 1
-    input1 = copy.deepcopy(base_pubs)
+    input1 = create_dataset()
     deduped1 = mgr._deduplicate_results(input1)
     checker.check_publications(deduped1)
     # Ensure scores are calculated
@@ -50,7 +48,7 @@ def main():
     scores1 = {p.doi: p.compliance_score for p in deduped1}
     
     # Run 2
-    input2 = copy.deepcopy(base_pubs)
+    input2 = create_dataset()
     deduped2 = mgr._deduplicate_results(input2)
     checker.check_publications(deduped2)
     for p in deduped2: